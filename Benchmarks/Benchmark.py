@@ -0,0 +1,445 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+#  - mysql-connector-python (GPLv2) for MySQL database connections
+
+"""Timed scenarios for SQLManager, Logger and the table views, with JSON results.
+
+Run from the repository root:
+    python -m Benchmarks.Benchmark run --sizes 1k,100k --output results.json
+    python -m Benchmarks.Benchmark run --backends mysql --mysql-database inventory_bench ...
+    python -m Benchmarks.Benchmark compare baseline.json results.json --threshold 0.15
+    python -m Benchmarks.Benchmark memory --sizes 1m
+
+Every (backend, size) pair gets a freshly generated database. SQLite runs in a temporary directory;
+MySQL needs a dedicated database whose name contains "bench", because its tables are emptied first.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import tempfile
+import tracemalloc
+import subprocess
+from pathlib import Path
+
+# Table scenarios need a QApplication, but never a screen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer, QT_VERSION_STR
+from PyQt6.QtWidgets import QApplication
+from Modules.Config import Config
+from Modules.Logger import Logger
+from Modules.SQLManager import SQLManager
+from Modules.DatabaseWorker import DatabaseWorker
+from Modules.ItemStore import ItemStore
+from Modules.InventoryApp import InventoryApp
+from Benchmarks.DataGenerator import populate, generate_items
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+WRITE_COUNT = 1000      # rows written by each add_item scenario
+LOG_COUNT = 10000       # entries pushed through Logger.log
+SCAN_BATCH = 500        # codes per increment_items flush, like ScanPipeline.max_batch
+PARTIAL_IMPORT = 10000  # existing rows with new quantities in the partial-update import
+ITEM_TERMS = ["P0000", "blue wid", "idget 12", "wdget"]   # code prefix, name prefix, substring, fuzzy
+LOG_TERMS = ["scanned", "updated p", "admin"]
+
+
+# -------------------------
+# Timing
+# -------------------------
+class Scenario:
+    """One timed operation; setup runs before every repetition and is not timed."""
+
+    def __init__(self, name, ops, run, setup=None):
+        self.name = name
+        self.ops = ops      # operations per repetition, for the throughput figure
+        self.run = run
+        self.setup = setup
+
+    def measure(self, repeat):
+        runs = []
+        for _ in range(repeat):
+            if self.setup is not None:
+                self.setup()
+            start = time.perf_counter()
+            self.run()
+            runs.append(time.perf_counter() - start)
+        median = statistics.median(runs)
+        return {
+            "scenario": self.name,
+            "ops": self.ops,
+            "runs": [round(run, 6) for run in runs],
+            "min": round(min(runs), 6),
+            "median": round(median, 6),
+            "ops_per_sec": round(self.ops / median, 1) if median > 0 else None,
+        }
+
+
+def pump(app, ms=0):
+    """Let queued signals and paint events run."""
+    if ms:
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+    app.processEvents()
+
+
+# -------------------------
+# Backends
+# -------------------------
+def open_sqlite():
+    sql = SQLManager()
+    sql.connect_sqlite()
+    return sql
+
+
+def open_mysql(args):
+    if "bench" not in args.mysql_database:
+        raise SystemExit("Refusing to empty a MySQL database whose name does not contain 'bench'")
+    sql = SQLManager(args.mysql_host, args.mysql_user, args.mysql_password, args.mysql_database, args.mysql_port)
+    if not sql.mysql:
+        return None
+    # Migrations created the tables; start from empty ones
+    sql.execute_query("DELETE FROM inventory")
+    sql.execute_query("DELETE FROM logs")
+    return sql
+
+
+def close(sql):
+    """Stop the shared threads and forget the singletons so the next database starts clean."""
+    Logger.shutdown()
+    if DatabaseWorker.SELF is not None:
+        DatabaseWorker.SELF.shutdown()
+    sql.release()
+    sql.close()
+    SQLManager.SELF = None
+    Config.SELF = None
+
+
+# -------------------------
+# Scenarios
+# -------------------------
+def scenarios(sql, app, window, size):
+    counter = iter(range(10**9))
+
+    def fresh_items(count):
+        # Codes that do not exist yet, so every repetition inserts instead of failing
+        base = next(counter) * count
+        return [(name, f"B{base + i:09d}", qty) for i, (name, code, qty) in enumerate(generate_items(count, seed=base))]
+
+    pending = {}
+
+    def prepare_writes():
+        pending["items"] = fresh_items(WRITE_COUNT)
+
+    def add_item_loop():
+        for name, code, qty in pending["items"]:
+            sql.add_item(name, code, qty)
+
+    def add_item_transaction():
+        with sql.transaction():
+            for name, code, qty in pending["items"]:
+                sql.add_item(name, code, qty)
+
+    def add_item_batch():
+        sql.execute_many(sql.dialect.upsert_item, pending["items"])
+
+    scan_codes = [f"P{i:08d}" for i in range(0, size, max(size // SCAN_BATCH, 1))][:SCAN_BATCH]
+
+    def write_vendor_file(path, items):
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "code", "qty"])
+            writer.writerows(items)
+
+    def prepare_import():
+        # A vendor file covering the whole catalogue with new quantities, as the bulk path sees it
+        if not os.path.exists("import_all.csv"):
+            write_vendor_file("import_all.csv", ((name, code, qty + 1) for name, code, qty in generate_items(size)))
+
+    def prepare_small_import():
+        # Few new rows into a large catalogue keep the per-row triggers
+        write_vendor_file("import_small.csv", fresh_items(WRITE_COUNT))
+
+    def prepare_partial_import():
+        # The usual vendor update: part of the catalogue, spread over it, with quantities that differ every run
+        step = next(counter) + 1
+        items = list(generate_items(size))[::max(size // PARTIAL_IMPORT, 1)][:PARTIAL_IMPORT]
+        write_vendor_file("import_partial.csv", ((name, code, qty + step) for name, code, qty in items))
+
+    def increment_items():
+        sql.increment_items((code, 1) for code in scan_codes)
+
+    synced = {}
+
+    def prepare_sync():
+        synced["mark"] = sql.sync_items()[0]
+        sql.increment_items((code, 1) for code in scan_codes)
+
+    def sync_items():
+        # Reads the scan batch plus whatever else changed within SYNC_OVERLAP seconds
+        sql.sync_items(synced["mark"])
+
+    def logger_throughput():
+        for i in range(LOG_COUNT):
+            Logger.log(f"Benchmark entry {i}")
+        Logger.flush()
+
+    loaded = {}
+
+    def load_rows():
+        loaded["items"] = sql.select_items() or []
+        loaded["logs"] = sql.execute_query("SELECT id, user_id, timestamp, message FROM logs ORDER BY timestamp DESC, id DESC") or []
+
+    def populate_table():
+        window.populate_table(ItemStore(loaded["items"]))
+        pump(app)
+
+    def populate_log_table():
+        window.log_model.set_rows(loaded["logs"])
+        pump(app)
+
+    def search_items():
+        for term in ITEM_TERMS:
+            sql.search_items(term)
+
+    def search_logs():
+        for term in LOG_TERMS:
+            sql.search_logs(term)
+
+    def log_pages():
+        # First page, then ten pages deeper through the keyset cursor
+        page = sql.select_logs_page(limit=200)
+        for _ in range(10):
+            if not page:
+                break
+            last = page[-1]
+            page = sql.select_logs_page(before=(last[2], last[0]), limit=200)
+
+    return [
+        Scenario("select_items", size, lambda: sql.select_items()),
+        Scenario("add_item_loop", WRITE_COUNT, add_item_loop, setup=prepare_writes),
+        Scenario("add_item_transaction", WRITE_COUNT, add_item_transaction, setup=prepare_writes),
+        Scenario("add_item_batch", WRITE_COUNT, add_item_batch, setup=prepare_writes),
+        Scenario("import_items", size, lambda: sql.import_items("import_all.csv"), setup=prepare_import),
+        Scenario("import_items_small", WRITE_COUNT, lambda: sql.import_items("import_small.csv"), setup=prepare_small_import),
+        Scenario("import_items_partial", min(PARTIAL_IMPORT, size), lambda: sql.import_items("import_partial.csv"), setup=prepare_partial_import),
+        Scenario("increment_items", len(scan_codes), increment_items),
+        Scenario("sync_items", len(scan_codes), sync_items, setup=prepare_sync),
+        Scenario("logger_log", LOG_COUNT, logger_throughput),
+        Scenario("populate_table", size, populate_table, setup=load_rows),
+        Scenario("populate_log_table", size, populate_log_table, setup=load_rows),
+        Scenario("search_items", len(ITEM_TERMS), search_items),
+        Scenario("search_logs", len(LOG_TERMS), search_logs),
+        Scenario("select_logs_pages", 11, log_pages),
+    ]
+
+
+def run_backend(backend, label, size, args, app):
+    workdir = Path(tempfile.mkdtemp(prefix=f"inventory_bench_{backend}_{label}_"))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    Config.SELF = None
+    Config.singleton().set_many({"user": "benchmark"})
+    sql = open_sqlite() if backend == "sqlite" else open_mysql(args)
+    if sql is None:
+        print(f"MySQL is not reachable, skipping {label}")
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+        return []
+    SQLManager.SELF = sql
+
+    results = []
+    try:
+        start = time.perf_counter()
+        populate(sql, size, size)
+        print(f"[{backend} {label}] generated {size} items and logs in {time.perf_counter() - start:.1f}s")
+
+        window = InventoryApp()
+        pump(app, 200)  # initial loads
+        # Its polling would compete with every write scenario for the GIL
+        window.change_feed.stop()
+
+        for scenario in scenarios(sql, app, window, size):
+            if args.scenarios and scenario.name not in args.scenarios:
+                continue
+            result = scenario.measure(args.repeat)
+            result.update(backend=backend, size=size)
+            results.append(result)
+            print(f"[{backend} {label}] {scenario.name:<22} median {result['median'] * 1000:9.2f} ms"
+                  f"  {result['ops_per_sec'] or 0:>12,.0f} ops/s")
+
+        window.close()
+        window.deleteLater()
+        pump(app)
+    finally:
+        close(sql)
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import sqlite3
+    import mysql.connector
+    return {
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "mysql_connector": mysql.connector.__version__,
+        "qt": QT_VERSION_STR,
+    }
+
+
+def run(args):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = []
+    for label in args.sizes:
+        for backend in args.backends:
+            results.extend(run_backend(backend, label, SIZES[label], args, app))
+    report = {"environment": environment(), "repeat": args.repeat, "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"Results written to {args.output}")
+    else:
+        print(json.dumps(report, indent=4))
+
+
+# -------------------------
+# Memory
+# -------------------------
+def fetched_items(size):
+    """Item rows as a database cursor returns them: fresh strings and ints in every row."""
+    return [(i + 1, "".join(name), "".join(code), qty) for i, (name, code, qty) in enumerate(generate_items(size))]
+
+
+def traced(build):
+    """Bytes still allocated by whatever build() returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        return tracemalloc.get_traced_memory()[0] - before, kept
+    finally:
+        tracemalloc.stop()
+
+
+def memory(args):
+    """Print the bytes per item of the in-memory inventory, as tuples with indexes and as an ItemStore."""
+    for label in args.sizes:
+        size = SIZES[label]
+
+        def tuples():
+            rows = fetched_items(size)
+            # What the window kept before ItemStore: the rows plus id and code lookups
+            return rows, {row[0]: i for i, row in enumerate(rows)}, {row[2]: i for i, row in enumerate(rows)}
+
+        tuple_bytes, kept = traced(tuples)
+        del kept
+        store_bytes, kept = traced(lambda: ItemStore(fetched_items(size)))
+        del kept
+        print(f"{label:>5}  tuples {tuple_bytes / size:7.1f} B/item   ItemStore {store_bytes / size:7.1f} B/item"
+              f"   ({store_bytes / tuple_bytes - 1:+.0%})")
+
+
+# -------------------------
+# Comparison
+# -------------------------
+def compare(args):
+    """Print the median change per scenario; exit with 1 when one got slower than the threshold allows."""
+    def load(path):
+        with open(path, encoding="utf-8") as f:
+            return {(r["backend"], r["size"], r["scenario"]): r for r in json.load(f)["results"]}
+
+    baseline, current = load(args.baseline), load(args.current)
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[key]["median"], current[key]["median"]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        backend, size, scenario = key
+        print(f"{backend:<7}{size:>9}  {scenario:<22}{old * 1000:10.2f} ms -> {new * 1000:10.2f} ms  {change:+7.1%}{flag}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inventory Manager benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="generate data and time every scenario")
+    run_parser.add_argument("--sizes", default="1k,100k", help=f"comma separated, from {', '.join(SIZES)}")
+    run_parser.add_argument("--backends", default="sqlite", help="comma separated: sqlite, mysql")
+    run_parser.add_argument("--scenarios", default="", help="comma separated scenario names (default: all)")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--output", help="JSON file for the results (default: stdout)")
+    run_parser.add_argument("--mysql-host", default="127.0.0.1")
+    run_parser.add_argument("--mysql-port", type=int, default=3306)
+    run_parser.add_argument("--mysql-user", default="root")
+    run_parser.add_argument("--mysql-password", default="")
+    run_parser.add_argument("--mysql-database", default="inventory_bench")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+
+    memory_parser = commands.add_parser("memory", help="measure the in-memory item store")
+    memory_parser.add_argument("--sizes", default="100k,1m", help=f"comma separated, from {', '.join(SIZES)}")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        sys.exit(compare(args))
+    if args.command == "memory":
+        args.sizes = [size.strip().lower() for size in args.sizes.split(",") if size.strip()]
+        for label in args.sizes:
+            if label not in SIZES:
+                parser.error(f"unknown size {label}")
+        memory(args)
+        return
+
+    args.sizes = [size.strip().lower() for size in args.sizes.split(",") if size.strip()]
+    args.backends = [backend.strip().lower() for backend in args.backends.split(",") if backend.strip()]
+    args.scenarios = {name.strip() for name in args.scenarios.split(",") if name.strip()}
+    for label in args.sizes:
+        if label not in SIZES:
+            parser.error(f"unknown size {label}")
+    for backend in args.backends:
+        if backend not in ("sqlite", "mysql"):
+            parser.error(f"unknown backend {backend}")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
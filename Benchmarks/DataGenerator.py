@@ -0,0 +1,66 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import random
+import itertools
+
+# Word lists for names that look like a real catalogue (shared prefixes, repeated words)
+ADJECTIVES = ["Blue", "Red", "Green", "Steel", "Brass", "Large", "Small", "Heavy", "Light", "Pro", "Mini", "Ultra"]
+NOUNS = ["Widget", "Gadget", "Bolt", "Screw", "Washer", "Bracket", "Hinge", "Cable", "Valve", "Sensor", "Filter", "Spring"]
+USERS = ["admin", "warehouse", "scanner1", "scanner2", "office", "night_shift"]
+
+
+def generate_items(count, seed=0):
+    """Yield count reproducible (name, code, qty) rows with unique codes."""
+    rng = random.Random(seed)
+    for i in range(count):
+        name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.randint(1, 999)}"
+        yield name, f"P{i:08d}", rng.randint(0, 5000)
+
+
+def generate_logs(count, item_count, seed=0):
+    """Yield count reproducible (user_id, message) rows that mention existing item codes."""
+    rng = random.Random(seed + 1)
+    for _ in range(count):
+        code = f"P{rng.randrange(max(item_count, 1)):08d}"
+        kind = rng.random()
+        if kind < 0.7:
+            message = f"Scanned product {code}: +{rng.randint(1, 20)} → {rng.randint(0, 5000)}"
+        elif kind < 0.9:
+            message = f"Updated product {code} → Quantity: {rng.randint(0, 5000)}"
+        else:
+            message = f"Added item: {rng.choice(NOUNS)} (Code: {code})"
+        yield rng.choice(USERS), message
+
+
+def batched(rows, size):
+    """Split an iterable into lists of at most size rows."""
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def populate(sql, items, logs, batch_size=10000, seed=0):
+    """Fill an empty database with items and logs through SQLManager's batch writes."""
+    for batch in batched(generate_items(items, seed), batch_size):
+        if sql.execute_many(sql.dialect.upsert_item, batch) is None:
+            raise RuntimeError("Could not insert benchmark items")
+    for batch in batched(generate_logs(logs, items, seed), batch_size):
+        if sql.add_logs(batch) is None:
+            raise RuntimeError("Could not insert benchmark logs")
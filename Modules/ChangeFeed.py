@@ -0,0 +1,181 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import time
+import threading
+from Modules.SQLManager import SQLManager
+from Modules.Metrics import Metrics
+
+class ChangeFeed(threading.Thread):
+    """Background thread that tails the changes journal and reports items other clients changed.
+
+    Every write to inventory adds a journal entry in the same transaction. The feed reads entries
+    past the last ID it handled and hands the items' current rows to its listeners, so applying
+    them is idempotent and never rolls a row back to an older value.
+    """
+
+    def __init__(self, sql: SQLManager = None, poll_interval=1.0, batch_size=1000, gap_timeout=10.0):
+        super().__init__(name="ChangeFeed", daemon=True)
+        self._sql = sql                     # database the journal is read from (follows its reconnects)
+        self.poll_interval = poll_interval  # seconds between polls
+        self.batch_size = batch_size        # max journal entries read per poll
+        self.gap_timeout = gap_timeout      # seconds to wait for a missing ID before skipping it
+        self.listeners = []                 # called (on this thread) with (rows, deleted_ids)
+        self.lost_listeners = []            # called when the changes cannot be listed (entries missed, a bulk import)
+        self.lock = threading.Lock()
+        self.source = None                  # database the cursor belongs to
+        self.cursor = None                  # ID of the last journal entry handled
+        self._seen = set()                  # IDs past a gap that were already reported
+        self._gap_started = None
+        self._last_poll = None
+        self._stop_event = threading.Event()
+
+    @property
+    def sql(self) -> SQLManager:
+        """The manager given to the constructor, or the shared one.
+
+        The shared one is looked up on first use, i.e. on the feed's own thread: creating it
+        connects, which must not hold up the window being built.
+        """
+        if self._sql is None:
+            self._sql = SQLManager.singleton()
+        return self._sql
+
+    def follow(self, mark):
+        """Make sure the feed covers everything after a sync mark (see SQLManager.sync_items).
+
+        The cursor only ever moves back: entries read twice are harmless, skipped ones are not.
+        """
+        if mark is None or len(mark) < 3 or mark[2] is None:
+            return
+        source, _, change_id = mark
+        with self.lock:
+            if self.source != source or self.cursor is None or change_id < self.cursor:
+                self.source = source
+                self.cursor = change_id
+                self._seen.clear()
+                self._gap_started = None
+
+    def run(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.poll()
+                # Rate limited inside; _expired() relies on entries going away after CHANGES_DAYS
+                self.sql.prune_history()
+            except Exception as e:
+                print(f"Error reading change feed: {e}")
+        # Hand this thread's database connection back before exiting
+        if self._sql is not None:
+            self._sql.release()
+
+    def poll(self):
+        """Read new journal entries once and notify the listeners."""
+        sql = self.sql
+        with self.lock:
+            if self.source != sql.source or self._expired():
+                # Start from the newest entry; a full refresh covers everything before it
+                latest = sql.latest_change_id()
+                if latest is None:
+                    return
+                lost = self.cursor is not None
+                self.source, self.cursor = sql.source, latest
+                self._seen.clear()
+                self._gap_started = None
+                self._last_poll = time.time()
+            else:
+                lost = None
+                start = cursor = self.cursor
+                seen, gap_started = set(self._seen), self._gap_started
+        if lost is not None:
+            if lost:
+                self.notify_lost()
+            return
+
+        changes = sql.select_changes(cursor, self.batch_size)
+        if changes is None:
+            return
+
+        now = time.monotonic()
+        item_ids = {}  # insertion-ordered set
+        refresh = False
+        held = False
+        for change_id, item_id in changes:
+            if not held:
+                if change_id == cursor + 1:
+                    # Any gap waited for at the cursor has filled; a later one gets its own wait
+                    gap_started = None
+                else:
+                    # A missing ID may belong to a transaction that has not committed yet; wait for
+                    # it for a while, then assume it was rolled back
+                    if gap_started is None:
+                        gap_started = now
+                    if now - gap_started < self.gap_timeout:
+                        held = True
+                    else:
+                        gap_started = None
+            if not held:
+                cursor = change_id
+            if change_id not in seen:
+                if item_id == SQLManager.JOURNAL_REFRESH:
+                    refresh = True
+                else:
+                    item_ids[item_id] = None
+                if held:
+                    seen.add(change_id)
+        if not held:
+            gap_started = None
+
+        rows = sql.select_items_by_id(item_ids) if item_ids else []
+        if rows is None:
+            return
+        with self.lock:
+            # follow() may have moved the cursor back meanwhile; then the next poll reads from there
+            if self.source == sql.source and self.cursor == start:
+                self.cursor = cursor
+                self._seen = {change_id for change_id in seen if change_id > cursor}
+                self._gap_started = gap_started
+            self._last_poll = time.time()
+        if item_ids:
+            found = {row[0] for row in rows}
+            Metrics.count("feed items", len(item_ids))
+            self.notify(rows, [item_id for item_id in item_ids if item_id not in found])
+        if refresh:
+            self.notify_lost()
+
+    def _expired(self):
+        """Whether the feed stopped long enough (e.g. a suspended laptop) for entries to be pruned."""
+        if self.cursor is None:
+            return True
+        return self._last_poll is not None and time.time() - self._last_poll > SQLManager.CHANGES_DAYS * 86400 / 2
+
+    def notify(self, rows, deleted):
+        for listener in list(self.listeners):
+            try:
+                listener(rows, deleted)
+            except Exception as e:
+                print(f"Error notifying change listener: {e}")
+
+    def notify_lost(self):
+        for listener in list(self.lost_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Error notifying change listener: {e}")
+
+    def stop(self):
+        """End the thread after the poll in progress."""
+        self._stop_event.set()
+        self.join()
@@ -0,0 +1,86 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import os
+import json
+import base64
+import threading
+from pathlib import Path
+
+class Config:
+    SELF = None  # This is the class-level singleton reference
+
+    @staticmethod
+    def singleton():
+        """Static method to return the singleton instance."""
+        if Config.SELF is None:
+            Config.SELF = Config()
+        return Config.SELF
+
+    def __init__(self, FILE: Path = Path("data/config.json")):
+        self.FILE = FILE
+        self.lock = threading.Lock()
+        self._raw = {}       # values as stored in the file (base64)
+        self._values = {}    # decoded values
+        self._stamp = None   # (mtime, size) of the file when it was last read
+
+    def _file_stamp(self):
+        try:
+            stat = self.FILE.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload_if_changed(self):
+        """Re-read the file only when it changed on disk since the last read."""
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return
+        raw = {}
+        if stamp is not None:
+            with self.FILE.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+        self._raw = raw
+        self._values = {key: base64.b64decode(value.encode()).decode() for key, value in raw.items()}
+        self._stamp = stamp
+
+    def get(self, parameter: str, default=None):
+        """Return the decoded value of a parameter, or default when it is not set."""
+        with self.lock:
+            self._reload_if_changed()
+            return self._values.get(parameter, default)
+
+    def set(self, parameter: str, value):
+        self.set_many({parameter: value})
+
+    def set_many(self, values: dict):
+        """Store several parameters with a single atomic write."""
+        with self.lock:
+            self._reload_if_changed()
+            raw = dict(self._raw)
+            for parameter, value in values.items():
+                raw[parameter] = base64.b64encode(str(value).encode()).decode()
+
+            # Write to a temporary file first so readers never see a half-written config
+            self.FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.FILE.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(raw, f, indent=4)  # pretty formatting
+            os.replace(tmp, self.FILE)
+
+            self._raw = raw
+            self._values.update({parameter: str(value) for parameter, value in values.items()})
+            self._stamp = self._file_stamp()
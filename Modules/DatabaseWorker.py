@@ -0,0 +1,88 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class DatabaseWorker(QObject):
+    """Runs database calls on a dedicated thread and hands results back to the GUI thread."""
+
+    SELF = None  # This is the class-level singleton reference
+
+    # (on_result, on_error, future) - emitted from the worker thread, delivered on the GUI thread
+    _finished = pyqtSignal(object, object, object)
+
+    @staticmethod
+    def singleton():
+        """Static method to return the singleton instance (create it on the GUI thread)."""
+        if DatabaseWorker.SELF is None:
+            DatabaseWorker.SELF = DatabaseWorker()
+        return DatabaseWorker.SELF
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One thread keeps every statement in submission order on a single connection
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DatabaseWorker")
+        # Long reads (exports) run beside it on their own connections so they do not hold up edits
+        self.jobs = ThreadPoolExecutor(max_workers=2, thread_name_prefix="DatabaseJob")
+        self._finished.connect(self._deliver)
+
+    def submit(self, fn, *args, on_result=None, on_error=None, **kwargs) -> Future:
+        """Run fn(*args, **kwargs) off the GUI thread; on_result/on_error are called on the GUI thread."""
+        future = self.executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self._finished.emit(on_result, on_error, f))
+        return future
+
+    def submit_job(self, fn, *args, on_result=None, on_error=None, **kwargs) -> Future:
+        """Like submit(), but for long-running reads that may run concurrently with the worker."""
+        future = self.jobs.submit(DatabaseWorker._run_job, fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self._finished.emit(on_result, on_error, f))
+        return future
+
+    @staticmethod
+    def _run_job(fn, *args, **kwargs):
+        from Modules.SQLManager import SQLManager
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # Job threads are shared, so hand a pooled MySQL connection back after every job;
+            # a SQLite connection stays open to keep its page cache warm for the next job
+            if SQLManager.SELF is not None and SQLManager.SELF.mysql:
+                SQLManager.SELF.release()
+
+    def _deliver(self, on_result, on_error, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            else:
+                print(f"Error in database worker: {error}")
+        elif on_result is not None:
+            on_result(future.result())
+
+    def shutdown(self, wait=True):
+        """Finish queued work, return the worker's connection and stop the thread."""
+        from Modules.SQLManager import SQLManager
+        if SQLManager.SELF is not None:
+            self.executor.submit(SQLManager.SELF.release)
+        self.executor.shutdown(wait=wait)
+        self.jobs.shutdown(wait=wait)
+        if SQLManager.SELF is not None:
+            # Job threads keep their SQLite connections, so close those now that the threads are idle
+            SQLManager.SELF.close()
+        DatabaseWorker.SELF = None
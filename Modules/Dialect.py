@@ -0,0 +1,178 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+class Dialect:
+    """The SQL that differs between backends; SQLManager picks one when it connects.
+
+    Queries are written once with ? placeholders and translated on first use. The translation is
+    cached, so the same query always maps to the same string object - a MySQL prepared cursor
+    only re-prepares when it is handed a different object.
+    """
+
+    name = None
+    prepared = False     # whether hot statements run on server-side prepared cursors
+    like_escape = ""     # ESCAPE clause for LIKE patterns escaped with a backslash
+    MAX_STATEMENTS = 1024
+
+    def __init__(self):
+        self._statements = {}
+
+    def sql(self, query):
+        """Return this backend's text for a query written with ? placeholders."""
+        statement = self._statements.get(query)
+        if statement is None:
+            if len(self._statements) >= self.MAX_STATEMENTS:
+                # Only generated queries (IN lists of varying length) can grow the cache this far
+                self._statements.clear()
+            statement = self._statements.setdefault(query, self.translate(query))
+        return statement
+
+    def translate(self, query):
+        return query
+
+    def nocase(self, column):
+        """Expression that orders a column the way its case-insensitive index does."""
+        return column
+
+    def explain(self, statement):
+        """Statement that returns the query plan instead of running it."""
+        return "EXPLAIN " + statement
+
+    def plan_lines(self, rows):
+        """Readable lines from the rows the explain statement returned."""
+        return [" | ".join("" if value is None else str(value) for value in row) for row in rows]
+
+    def sync_mark(self, overlap):
+        """(query, params) for the server's clock minus overlap seconds, in the format updated_at uses."""
+        raise NotImplementedError
+
+    # -------------------------
+    # Statements that differ in more than their placeholders
+    # -------------------------
+    upsert_item = ""
+
+    def item_substring(self, term, limit):
+        """(query, params) for items containing term, or None when the index cannot answer it."""
+        raise NotImplementedError
+
+    def item_fuzzy(self, term, limit):
+        """(query, params) for items ranked by how many of term's n-grams they share."""
+        raise NotImplementedError
+
+    def log_search(self, words, limit, offset):
+        """(query, params) for a ranked page of logs matching every word as a prefix."""
+        raise NotImplementedError
+
+
+class SQLiteDialect(Dialect):
+    name = "sqlite"
+    like_escape = "ESCAPE '\\'"
+
+    # Stamps updated_at itself, so bulk imports can run without the touch triggers
+    upsert_item = (
+        "INSERT INTO inventory (name, code, qty, updated_at) "
+        "VALUES (?, ?, ?, strftime('%Y-%m-%d %H:%M:%f', 'now')) "
+        "ON CONFLICT(code) DO UPDATE SET name = excluded.name, qty = excluded.qty, updated_at = excluded.updated_at"
+    )
+
+    # sqlite3 already keeps a per-connection cache of compiled statements keyed by their text
+
+    def nocase(self, column):
+        return f"{column} COLLATE NOCASE"
+
+    def explain(self, statement):
+        return "EXPLAIN QUERY PLAN " + statement
+
+    def plan_lines(self, rows):
+        # Rows are (id, parent, notused, detail); indent each step under its parent
+        depth = {0: 0}
+        lines = []
+        for node, parent, _, detail in rows:
+            depth[node] = depth.get(parent, 0) + 1
+            lines.append("  " * (depth[node] - 1) + detail)
+        return lines
+
+    def sync_mark(self, overlap):
+        return "SELECT strftime('%Y-%m-%d %H:%M:%f', 'now', ?)", (f"-{overlap} seconds",)
+
+    def item_substring(self, term, limit):
+        if len(term) < 3:
+            return None  # trigrams need three characters
+        phrase = '"' + term.replace('"', '""') + '"'
+        return "SELECT rowid FROM inventory_fts WHERE inventory_fts MATCH ? LIMIT ?", (phrase, limit)
+
+    def item_fuzzy(self, term, limit):
+        trigrams = {term[i:i + 3].replace('"', '""') for i in range(len(term) - 2)}
+        if not trigrams:
+            return None
+        query = "SELECT rowid FROM inventory_fts WHERE inventory_fts MATCH ? ORDER BY rank LIMIT ?"
+        return query, (" OR ".join(f'"{trigram}"' for trigram in trigrams), limit)
+
+    LOG_SEARCH_WINDOW = 2000  # newest full-text hits that get ranked (and can be paged through)
+
+    def log_search(self, words, limit, offset):
+        match = " ".join(f'"{word}"*' for word in words)
+        # Rank only the newest matches: scoring every hit of a common word would scan the whole index.
+        # The window stays the same for every page; growing it with the offset would re-rank the
+        # candidates and repeat or skip rows between pages
+        query = (
+            "SELECT logs.id, logs.user_id, logs.timestamp, logs.message FROM ("
+            "    SELECT rowid, rank FROM logs_fts WHERE logs_fts MATCH ? ORDER BY rowid DESC LIMIT ?"
+            ") AS hits JOIN logs ON logs.id = hits.rowid "
+            "ORDER BY hits.rank, logs.id DESC LIMIT ? OFFSET ?"
+        )
+        return query, (match, SQLiteDialect.LOG_SEARCH_WINDOW, limit, offset)
+
+
+class MySQLDialect(Dialect):
+    name = "mysql"
+    prepared = True
+    like_escape = "ESCAPE '\\\\'"  # backslashes are escapes inside MySQL string literals
+
+    upsert_item = (
+        "INSERT INTO inventory (name, code, qty) VALUES (?, ?, ?) "
+        "ON DUPLICATE KEY UPDATE name = VALUES(name), qty = VALUES(qty)"
+    )
+
+    def sync_mark(self, overlap):
+        return "SELECT NOW(6) - INTERVAL ? SECOND", (overlap,)
+
+    def translate(self, query):
+        # The plain cursor only understands %s; the prepared cursor accepts it too
+        return query.replace("?", "%s")
+
+    def item_substring(self, term, limit):
+        # The ngram parser indexes every 2-character sequence, so a phrase matches a substring
+        phrase = '"' + term.replace('"', '') + '"'
+        return "SELECT id FROM inventory WHERE MATCH(name, code) AGAINST (? IN BOOLEAN MODE) LIMIT ?", (phrase, limit)
+
+    def item_fuzzy(self, term, limit):
+        query = (
+            "SELECT id FROM inventory WHERE MATCH(name, code) AGAINST (? IN NATURAL LANGUAGE MODE) "
+            "ORDER BY MATCH(name, code) AGAINST (? IN NATURAL LANGUAGE MODE) DESC LIMIT ?"
+        )
+        return query, (term, term, limit)
+
+    def log_search(self, words, limit, offset):
+        # Every word must match, as a prefix so results show up while typing
+        match = " ".join(f"+{word}*" for word in words)
+        query = (
+            "SELECT id, user_id, timestamp, message FROM logs "
+            "WHERE MATCH(message, user_id) AGAINST (? IN BOOLEAN MODE) "
+            "ORDER BY MATCH(message, user_id) AGAINST (? IN BOOLEAN MODE) DESC, id DESC "
+            "LIMIT ? OFFSET ?"
+        )
+        return query, (match, match, limit, offset)
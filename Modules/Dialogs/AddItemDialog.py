@@ -26,8 +26,10 @@ from PyQt6.QtWidgets import  (
 )
 
 from ..WidgetStyle import WidgetStyle
+from ..Metrics import Metrics
 
 class AddItemDialog(QDialog):
+    @Metrics.timed("dialog AddItemDialog")
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -68,16 +70,16 @@ class AddItemDialog(QDialog):
         form_layout.addRow(qty_label, self.qty_input)
 
         # --- Buttons ---
-        confirm_button = QPushButton(self.t["confirm"], self)
-        WidgetStyle.setDefaultStyle(confirm_button)
+        self.confirm_button = QPushButton(self.t["confirm"], self)
+        WidgetStyle.setDefaultStyle(self.confirm_button)
         cancel_button = QPushButton(self.t["cancel"], self)
         WidgetStyle.setDefaultStyle(cancel_button)
 
-        confirm_button.clicked.connect(self.on_confirm)
+        self.confirm_button.clicked.connect(self.on_confirm)
         cancel_button.clicked.connect(self.reject)
 
         button_layout = QHBoxLayout()
-        button_layout.addWidget(confirm_button)
+        button_layout.addWidget(self.confirm_button)
         button_layout.addWidget(cancel_button)
 
         # --- Feedback Label ---
@@ -115,8 +117,17 @@ class AddItemDialog(QDialog):
 
         # --- Call parent's add_data_row ---
         if self.parent() and hasattr(self.parent(), "add_data_row"):
-            self.parent().add_data_row(name, code, qty)
-            self.feedback_label.setText(self.t["added_feedback"].format(name=name, code=code, qty=qty))
-            self.accept()
+            self.confirm_button.setEnabled(False)
+            self.parent().add_data_row(name, code, qty, on_done=lambda ok: self.on_added(ok, name, code, qty))
         else:
             self.feedback_label.setText("Error: Parent does not support add_data_row.")
+
+    def on_added(self, ok, name, code, qty):
+        """Called once the database worker has inserted (or failed to insert) the item."""
+        self.confirm_button.setEnabled(True)
+        if not ok:
+            WidgetStyle.setErrorStyle(self.code_input)
+            self.feedback_label.setText(self.t["add_failed_feedback"])
+            return
+        self.feedback_label.setText(self.t["added_feedback"].format(name=name, code=code, qty=qty))
+        self.accept()
@@ -27,12 +27,16 @@ from PyQt6.QtWidgets import  (
 )
 
 from ..WidgetStyle import WidgetStyle
+from ..Metrics import Metrics
 
 from ..WidgetStyle import WidgetStyle
 from ..Localization import translations
+from ..Config import Config
 from ..SQLManager import SQLManager
+from ..DatabaseWorker import DatabaseWorker
 
 class DatabaseConfigDialog(QDialog):
+    @Metrics.timed("dialog DatabaseConfigDialog")
     def __init__(self, parent=None, lang="en"):
         super().__init__(parent)
 
@@ -80,22 +84,22 @@ class DatabaseConfigDialog(QDialog):
         form_layout.addRow(pass_label, self.pass_input)
 
         # --- Buttons ---
-        confirm_button = QPushButton(self.t["save"])
-        WidgetStyle.setDefaultStyle(confirm_button)
+        self.confirm_button = QPushButton(self.t["save"])
+        WidgetStyle.setDefaultStyle(self.confirm_button)
 
-        test_button = QPushButton(self.t["test_connection"])
-        WidgetStyle.setDefaultStyle(test_button)
+        self.test_button = QPushButton(self.t["test_connection"])
+        WidgetStyle.setDefaultStyle(self.test_button)
 
         cancel_button = QPushButton(self.t["cancel"])
         WidgetStyle.setDefaultStyle(cancel_button)
 
-        confirm_button.clicked.connect(self.on_confirm)
-        test_button.clicked.connect(self.on_test)
+        self.confirm_button.clicked.connect(self.on_confirm)
+        self.test_button.clicked.connect(self.on_test)
         cancel_button.clicked.connect(self.reject)
 
         button_layout = QHBoxLayout()
-        button_layout.addWidget(test_button)
-        button_layout.addWidget(confirm_button)
+        button_layout.addWidget(self.test_button)
+        button_layout.addWidget(self.confirm_button)
         button_layout.addWidget(cancel_button)
 
         # --- Feedback Label ---
@@ -114,16 +118,28 @@ class DatabaseConfigDialog(QDialog):
     def on_confirm(self):
         """Return entered database info to parent."""
         
-        SQLManager.save_config("host", self.host_input.text().strip())
-        SQLManager.save_config("database", self.db_input.text().strip())
-        SQLManager.save_config("user", self.db_input.text().strip())
-        SQLManager.save_config("password", self.pass_input.text().strip())
-        SQLManager.save_config("port", self.port_input.text().strip())
-
-        SQLManager.singleton().config_connect()
-
-        # You’ll add saving logic here
-        self.accept()
+        Config.singleton().set_many({
+            "host": self.host_input.text().strip(),
+            "database": self.db_input.text().strip(),
+            "user": self.user_input.text().strip(),
+            "password": self.pass_input.text().strip(),
+            "port": self.port_input.value(),
+        })
+
+        def on_error(error):
+            # Leave the dialog open so the settings can be corrected and saved again
+            print(f"Error connecting to database: {error}")
+            self.confirm_button.setEnabled(True)
+            self.feedback_label.setText(self.t["connect_failed"].format(error=error))
+
+        # Reconnect off the GUI thread; a slow or unreachable server no longer freezes the window
+        self.confirm_button.setEnabled(False)
+        self.feedback_label.setText("Connecting...")
+        DatabaseWorker.singleton().submit(
+            lambda: SQLManager.singleton().config_connect(),
+            on_result=lambda result: self.accept(),
+            on_error=on_error,
+        )
 
     def on_test(self):
         """Dummy connection test (you already handle real checks)."""
@@ -133,12 +149,18 @@ class DatabaseConfigDialog(QDialog):
             self.feedback_label.setText("Please enter host and database first.")
             return
 
-        # Simulate quick check
-        if SQLManager.connection_test(
+        def on_result(ok):
+            self.test_button.setEnabled(True)
+            if ok: self.feedback_label.setText("Connection test successful.")
+            else: self.feedback_label.setText("Connection test Failed.")
+
+        self.test_button.setEnabled(False)
+        DatabaseWorker.singleton().submit(
+            SQLManager.connection_test,
             self.host_input.text().strip(), 
             self.user_input.text().strip(),
             self.pass_input.text().strip(),
             self.db_input.text().strip(),
-            self.port_input.value()
-        ): self.feedback_label.setText("Connection test successful.")
-        else: self.feedback_label.setText("Connection test Failed.")
\ No newline at end of file
+            self.port_input.value(),
+            on_result=on_result,
+        )
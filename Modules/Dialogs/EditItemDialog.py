@@ -28,10 +28,13 @@ from PyQt6.QtWidgets import (
 
 from ..Logger import Logger
 from ..WidgetStyle import WidgetStyle
+from ..Metrics import Metrics
 from ..SQLManager import SQLManager
+from ..DatabaseWorker import DatabaseWorker
 from Modules.Logger import Logger
 
 class EditItemDialog(QDialog):
+    @Metrics.timed("dialog EditItemDialog")
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -84,16 +87,16 @@ class EditItemDialog(QDialog):
         form_layout.addRow(qty_label, self.qty_input)
 
         # --- Buttons ---
-        confirm_button = QPushButton(self.t["confirm"])
-        WidgetStyle.setDefaultStyle(confirm_button)
+        self.confirm_button = QPushButton(self.t["confirm"])
+        WidgetStyle.setDefaultStyle(self.confirm_button)
         cancel_button = QPushButton(self.t["cancel"])
         WidgetStyle.setDefaultStyle(cancel_button)
 
-        confirm_button.clicked.connect(self.on_confirm)
+        self.confirm_button.clicked.connect(self.on_confirm)
         cancel_button.clicked.connect(self.reject)
 
         button_layout = QHBoxLayout()
-        button_layout.addWidget(confirm_button)
+        button_layout.addWidget(self.confirm_button)
         button_layout.addWidget(cancel_button)
 
         # --- Feedback Label ---
@@ -146,15 +149,39 @@ class EditItemDialog(QDialog):
         else:
             WidgetStyle.setDefaultStyle(self.code_input)
 
-        # Update Data
-        old_data = self.item_selector.itemData(index)
-        id, old_name, old_code, old_qty = old_data
-        SQLManager.singleton().update_item(id, new_name, new_code, new_qty)
-
-        if self.parent_app:
-            Logger.log(message=self.t["item_updated"].format(new_name=new_name, new_code=new_code, new_qty=new_qty, old_code=old_code, old_name=old_name))
-            self.parent_app.load_logs()
-            self.parent_app.update_table()
+        # Look up the current row; the combo box data may be stale
+        id = self.item_selector.itemData(index)[0]
+        row = self.parent_app.find_row(id) if self.parent_app else None
+        if row is not None:
+            id, old_name, old_code, old_qty = self.parent_app.data[row]
+            # Reject a code that already belongs to another item before touching the database
+            if self.parent_app.find_row_by_code(new_code) not in (None, row):
+                WidgetStyle.setErrorStyle(self.code_input)
+                self.feedback_label.setText(self.t["update_failed_feedback"])
+                return
+        else:
+            id, old_name, old_code, old_qty = self.item_selector.itemData(index)
+
+        def write():
+            # The update and its log entry commit together
+            sql = SQLManager.singleton()
+            with sql.transaction():
+                sql.update_item(id, new_name, new_code, new_qty)
+                Logger.log(message=self.t["item_updated"].format(new_name=new_name, new_code=new_code, new_qty=new_qty, old_code=old_code, old_name=old_name))
+
+        def on_result(result):
+            self.confirm_button.setEnabled(True)
+            if self.parent_app:
+                self.parent_app.apply_item_update((id, new_name, new_code, new_qty))
+
+            self.feedback_label.setText(self.t["name_updated"].format(new_name=new_name, new_code=new_code))
+            self.accept()
+
+        def on_error(error):
+            print(f"Error updating item: {error}")
+            self.confirm_button.setEnabled(True)
+            WidgetStyle.setErrorStyle(self.code_input)
+            self.feedback_label.setText(self.t["update_failed_feedback"])
 
-        self.feedback_label.setText(self.t["name_updated"].format(new_name=new_name, new_code=new_code))
-        self.accept()
+        self.confirm_button.setEnabled(False)
+        DatabaseWorker.singleton().submit(write, on_result=on_result, on_error=on_error)
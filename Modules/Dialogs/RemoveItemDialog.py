@@ -26,8 +26,10 @@ from PyQt6.QtWidgets import (
     QComboBox,
 )
 from ..WidgetStyle import WidgetStyle
+from ..Metrics import Metrics
 
 class RemoveItemDialog(QDialog):
+    @Metrics.timed("dialog RemoveItemDialog")
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -61,16 +63,16 @@ class RemoveItemDialog(QDialog):
         form_layout.addRow(code_label, self.confirm_code_input)
 
         # --- Buttons ---
-        confirm_button = QPushButton(self.t["confirm_removal"], self)
-        WidgetStyle.setDefaultStyle(confirm_button)
+        self.confirm_button = QPushButton(self.t["confirm_removal"], self)
+        WidgetStyle.setDefaultStyle(self.confirm_button)
         cancel_button = QPushButton(self.t["cancel"], self)
         WidgetStyle.setDefaultStyle(cancel_button)
 
-        confirm_button.clicked.connect(self.on_confirm)
+        self.confirm_button.clicked.connect(self.on_confirm)
         cancel_button.clicked.connect(self.reject)
 
         button_layout = QHBoxLayout()
-        button_layout.addWidget(confirm_button)
+        button_layout.addWidget(self.confirm_button)
         button_layout.addWidget(cancel_button)
 
         # --- Feedback Label ---
@@ -96,6 +98,9 @@ class RemoveItemDialog(QDialog):
     def on_confirm(self):
         """Remove the selected item if code matches confirmation input."""
         selected_index = self.item_selector.currentIndex()
+        if selected_index <= 0:
+            self.feedback_label.setText(self.t["select_placeholder"])
+            return
         id, selected_code = self.item_selector.itemData(selected_index)
         confirm_code = self.confirm_code_input.text().strip()
 
@@ -109,18 +114,31 @@ class RemoveItemDialog(QDialog):
         # Remove the item from parent data
         if self.parent_app and hasattr(self.parent_app, "data"):
             from Modules.SQLManager import SQLManager
-            index = self.item_selector.currentIndex()
-            data = self.item_selector.itemData(index)
-            id, code = data
-            SQLManager.singleton().remove_item(id)
-            print(id)
-
-            # Save changes and refresh table
-            self.parent_app.update_table()
+            if self.parent_app.find_row(id) is None:
+                self.feedback_label.setText(self.t["product_not_found"].format(code=selected_code))
+                return
+            from Modules.DatabaseWorker import DatabaseWorker
 
-            # Log the removal
             from Modules.Logger import Logger
-            Logger.log(self.t["item_removed"].format(selected_code=selected_code))
-            self.parent_app.load_logs()
-            
-            self.accept()
\ No newline at end of file
+
+            def write():
+                # The removal and its log entry commit together
+                sql = SQLManager.singleton()
+                with sql.transaction():
+                    sql.remove_item(id)
+                    Logger.log(self.t["item_removed"].format(selected_code=selected_code))
+
+            def on_result(result):
+                self.confirm_button.setEnabled(True)
+
+                # Drop the row from the cached data and the table
+                self.parent_app.apply_item_delete(id)
+
+                self.accept()
+
+            def on_error(error):
+                print(f"Error removing item: {error}")
+                self.confirm_button.setEnabled(True)
+
+            self.confirm_button.setEnabled(False)
+            DatabaseWorker.singleton().submit(write, on_result=on_result, on_error=on_error)
\ No newline at end of file
@@ -27,9 +27,11 @@ from PyQt6.QtWidgets import  (
 )
 
 from ..WidgetStyle import WidgetStyle
+from ..Metrics import Metrics
 from ..Localization import translations
 
 class ScanProductDialog(QDialog):
+    @Metrics.timed("dialog ScanProductDialog")
     def __init__(self, parent=None, table=None):
         super().__init__(parent)
 
@@ -100,6 +102,9 @@ class ScanProductDialog(QDialog):
             dialog_rect.moveCenter(parent_rect.center())
             self.move(dialog_rect.topLeft())
 
+        # Write any queued scans as soon as the dialog closes
+        self.finished.connect(lambda result: self.parent_ref.scan_pipeline.flush())
+
         # Focus on code input by default
         self.code_input.setFocus()
 
@@ -108,23 +113,19 @@ class ScanProductDialog(QDialog):
         qty = self.quantity_input.value()
 
         if not code:
-            self.feedback_label.setText("Please enter a product code!")
+            self.feedback_label.setText(self.t["enter_product_code_feedback"])
             return
 
-        found = False
-        for i, (name, item_code, current_qty) in enumerate(self.parent_ref.data):
-            if item_code == code:
-                new_qty = int(current_qty) + qty
-                self.parent_ref.data[i] = (name, item_code, str(new_qty))
-                self.feedback_label.setText(f"Updated '{name}' → {new_qty}")
-                found = True
-                break
-
-        if not found:
-            self.feedback_label.setText(f"Product code '{code}' not found!")
-
-        # Refresh table
-        self.parent_ref.populate_table(self.parent_ref.data)
+        row = self.parent_ref.find_row_by_code(code)
+        if row is None:
+            self.feedback_label.setText(self.t["product_not_found"].format(code=code))
+        else:
+            id, name, item_code, current_qty = self.parent_ref.data[row]
+            new_qty = current_qty + qty
+            # Show the scan immediately; the pipeline persists it as an atomic increment
+            self.parent_ref.scan_pipeline.enqueue(item_code, qty)
+            self.parent_ref.apply_item_update((id, name, item_code, new_qty))
+            self.feedback_label.setText(self.t["product_updated"].format(name=name, qty=new_qty))
 
         # Clear code input for next scan
         self.code_input.clear()
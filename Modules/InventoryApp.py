@@ -14,11 +14,12 @@
 # Dependencies:
 #  - PyQt6 (GPLv3) for the graphical user interface
 
+import re
 import json
 import base64
 from pathlib import Path
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QShortcut, QKeySequence, QFontDatabase
 from PyQt6.QtWidgets import  (
     QMainWindow, 
     QLineEdit, 
@@ -27,20 +28,30 @@ from PyQt6.QtWidgets import  (
     QLabel, 
     QPushButton,
     QHBoxLayout,
-    QTableWidget,
+    QTableView,
     QHeaderView,
-    QTableWidgetItem,
-    QStackedLayout
+    QStackedLayout,
+    QFileDialog,
+    QCheckBox,
+    QPlainTextEdit,
 )
 
-import datetime
 from pathlib import Path
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
+from Modules.Config import Config
 from Modules.Logger import Logger
 from Modules.SQLManager import SQLManager
+from Modules.Metrics import Metrics
+from Modules.DatabaseWorker import DatabaseWorker
 from Modules.WidgetStyle import WidgetStyle
 from Modules.Localization import translations
+from Modules.ItemStore import ItemStore
+from Modules.InventoryTableModel import InventoryTableModel
+from Modules.LogTableModel import LogTableModel
+from Modules.ScanPipeline import ScanPipeline
+from Modules.SearchController import SearchController
+from Modules.ChangeFeed import ChangeFeed
 from Modules.Dialogs.AddItemDialog import AddItemDialog
 from Modules.Dialogs.EditItemDialog import EditItemDialog
 from Modules.Dialogs.RemoveItemDialog import RemoveItemDialog
@@ -48,6 +59,17 @@ from Modules.Dialogs.ScanProductDialog import ScanProductDialog
 from Modules.Dialogs.DatabaseConfigDialog import DatabaseConfigDialog
 
 class InventoryApp(QMainWindow):
+    # Emitted from the log writer thread; Qt queues it onto the GUI thread
+    logsWritten = pyqtSignal()
+    # Emitted from the database worker with the number of rows imported so far
+    importProgress = pyqtSignal(int)
+    # Emitted from an export job with the number of rows written so far
+    exportProgress = pyqtSignal(int)
+    # Emitted from the change feed thread with (rows, deleted IDs) other clients changed
+    itemsChanged = pyqtSignal(object, object)
+    # Emitted from the change feed thread when it missed entries and everything must be re-read
+    changesLost = pyqtSignal()
+
     def __init__(self, lang="en"):
         """Create and set up the Application Window."""
         super().__init__()
@@ -60,12 +82,34 @@ class InventoryApp(QMainWindow):
         self.resize(800, 500)
         WidgetStyle.setDefaultStyle(self)
 
-        self.data = []
-        self.all_logs = []
+        self.data = ItemStore()  # every item, with id and code lookups
+        self.item_mark = None    # sync mark of self.data; refreshes only read what changed after it
+        self.log_generation = 0  # bumped on every full reload so late pages from before it are ignored
+
+        if Config.singleton().get("metrics") == "1":
+            Metrics.enable()
+
+        # Scans are queued and written as batched increments
+        self.scan_pipeline = ScanPipeline(parent=self)
+        self.scan_pipeline.flushed.connect(self.on_scans_flushed)
+
+        # Refresh the log view whenever the background writer commits a batch
+        self.logsWritten.connect(self.load_new_logs)
+        self.importProgress.connect(self.on_import_progress)
+        self.exportProgress.connect(self.on_export_progress)
+        Logger.add_listener(self.logsWritten.emit)
+
+        # Show edits from other terminals as they happen (the feed connects on its own thread)
+        self.change_feed = ChangeFeed()
+        self.itemsChanged.connect(self.apply_item_changes)
+        self.changesLost.connect(self.update_table)
+        self.change_feed.listeners.append(self.itemsChanged.emit)
+        self.change_feed.lost_listeners.append(self.changesLost.emit)
 
         self.init_ui()
         self.init_datatable()
         self.init_stacked_views()  # stacked layout for inventory, logs
+        self.change_feed.start()
 
     # -------------------------
     # UI Initialization
@@ -94,11 +138,21 @@ class InventoryApp(QMainWindow):
         self.remove_item_action.triggered.connect(self.remove_item_dialog)
         self.view_all_action = QAction(self.t["view_all"], self)
         self.view_all_action.triggered.connect(self.show_inventory_view)
+        self.import_action = QAction(self.t["import_items"], self)
+        self.import_action.triggered.connect(self.import_items_dialog)
+        self.export_items_action = QAction(self.t["export_items"], self)
+        self.export_items_action.triggered.connect(lambda: self.export_dialog("items"))
+        self.export_logs_action = QAction(self.t["export_logs"], self)
+        self.export_logs_action.triggered.connect(lambda: self.export_dialog("logs"))
 
         self.inventory_menu.addAction(self.add_item_action)
         self.inventory_menu.addAction(self.edit_item_action)
         self.inventory_menu.addAction(self.remove_item_action)
         self.inventory_menu.addAction(self.view_all_action)
+        self.inventory_menu.addSeparator()
+        self.inventory_menu.addAction(self.import_action)
+        self.inventory_menu.addAction(self.export_items_action)
+        self.inventory_menu.addAction(self.export_logs_action)
 
         # Logs menu
         self.view_logs_action = QAction(self.t["logs"], self)
@@ -155,6 +209,61 @@ class InventoryApp(QMainWindow):
             self.t["credits_content"],
         )
 
+    def import_items_dialog(self):
+        """Pick a vendor CSV/TSV file and upsert it in batches on the database worker."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, self.t["import_items"], "", "CSV / TSV (*.csv *.tsv *.txt);;All files (*)"
+        )
+        if not path:
+            return
+
+        def on_result(result):
+            self.import_action.setEnabled(True)
+            imported, skipped = result
+            message = self.t["import_done"].format(imported=imported, skipped=skipped, file=Path(path).name)
+            self.statusBar().showMessage(message)
+            Logger.log(message)  # one summary entry for the whole file
+            self.update_table()
+
+        def on_error(error):
+            self.import_action.setEnabled(True)
+            self.statusBar().showMessage(self.t["import_failed"].format(error=error))
+
+        self.import_action.setEnabled(False)
+        DatabaseWorker.singleton().submit(
+            lambda: SQLManager.singleton().import_items(path, progress=self.importProgress.emit),
+            on_result=on_result,
+            on_error=on_error,
+        )
+
+    def on_import_progress(self, rows):
+        self.statusBar().showMessage(self.t["import_progress"].format(rows=rows))
+
+    def export_dialog(self, table: str):
+        """Stream the inventory or the logs to a CSV/JSONL file on a background job."""
+        path, selected = QFileDialog.getSaveFileName(
+            self, self.t[f"export_{table}"], f"{table}.csv", "CSV (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not path:
+            return
+        fmt = "jsonl" if path.lower().endswith(".jsonl") or "jsonl" in selected else "csv"
+
+        def on_result(rows):
+            self.statusBar().showMessage(self.t["export_done"].format(rows=rows, file=Path(path).name))
+
+        def on_error(error):
+            self.statusBar().showMessage(self.t["export_failed"].format(error=error))
+
+        export = SQLManager.export_items if table == "items" else SQLManager.export_logs
+        DatabaseWorker.singleton().submit_job(
+            lambda: export(SQLManager.singleton(), path, fmt, progress=self.exportProgress.emit),
+            on_result=on_result,
+            on_error=on_error,
+        )
+
+    def on_export_progress(self, rows):
+        self.statusBar().showMessage(self.t["export_progress"].format(rows=rows))
+
     def database_config_dialog(self):
         dialog = DatabaseConfigDialog(self)
         dialog.exec()
@@ -166,12 +275,33 @@ class InventoryApp(QMainWindow):
     # -------------------------
     def init_datatable(self):
         """Create the main inventory table."""
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels([self.t["name"], self.t["code"], self.t["quantity"]])
+        # The models sort themselves (see InventoryTableModel.sort), so no proxy sits in between
+        self.table_model = InventoryTableModel(
+            self.data, headers=[self.t["name"], self.t["code"], self.t["quantity"]], parent=self
+        )
+
+        # Search hits come from the database and are shown in their own model
+        self.search_model = InventoryTableModel(
+            ItemStore(), headers=[self.t["name"], self.t["code"], self.t["quantity"]], parent=self
+        )
+
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.setSortingEnabled(True)
-        self.get_data()
-        self.update_table()
+
+        # Show the last known inventory at once, then read only what changed on the server since
+        if Config.singleton().get("host"):
+            def load_snapshot():
+                mark, rows = SQLManager.load_snapshot()
+                return mark, ItemStore(rows), None
+
+            def on_snapshot(result):
+                self.on_items_synced(result)
+                self.update_table()
+
+            DatabaseWorker.singleton().submit(load_snapshot, on_result=on_snapshot)
+        else:
+            self.update_table()
 
     # -------------------------
     # Stacked Layout: Welcome / Inventory / Logs
@@ -257,10 +387,18 @@ class InventoryApp(QMainWindow):
         WidgetStyle.setDefaultStyle(self.table)
 
         # Signals
-        self.search_button.clicked.connect(self.search_items)
+        self.item_search = SearchController(
+            self.search_input,
+            query=lambda term: SQLManager.singleton().search_items(term, limit=self.ITEM_SEARCH_LIMIT),
+            on_results=self.on_search_items,
+            on_cleared=self.on_search_items_cleared,
+            refine=self.refine_item_search,
+            parent=self,
+        )
+        self.search_button.clicked.connect(self.item_search.run)
         self.scan_button.clicked.connect(self.scan_product_dialog)
-        self.search_input.returnPressed.connect(self.search_items)
-        self.table.itemChanged.connect(self.on_table_item_changed)
+        self.table_model.quantityEdited.connect(self.on_table_item_changed)
+        self.search_model.quantityEdited.connect(self.on_table_item_changed)
 
         # --- Log Viewer Page ---
         self.log_widget = QWidget()
@@ -271,21 +409,34 @@ class InventoryApp(QMainWindow):
         self.log_search_input.setPlaceholderText(self.t["search_placeholder"])
         WidgetStyle.setDefaultStyle(self.log_search_input)
 
-        self.log_table = QTableWidget()
-        self.log_table.setColumnCount(2)
-        self.log_table.setHorizontalHeaderLabels([self.t["timestamp"], self.t["message"]])
+        self.log_model = LogTableModel(headers=[self.t["timestamp"], self.t["message"]], parent=self)
+        self.log_model.olderRequested.connect(self.load_older_logs)
+        # Search results are ranked pages from the full-text index, shown in place of the log model
+        self.log_search_model = LogTableModel(headers=[self.t["timestamp"], self.t["message"]], parent=self)
+        self.log_search_model.olderRequested.connect(self.load_more_search_results)
+
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_model)
         self.log_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.log_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.log_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.log_table.setStyleSheet(WidgetStyle.logTable)
 
         log_layout.addWidget(self.log_search_input)
         log_layout.addWidget(self.log_table)
-        self.log_search_input.textChanged.connect(self.filter_logs)
+        self.log_search = SearchController(
+            self.log_search_input,
+            query=lambda term: SQLManager.singleton().search_logs(term, limit=self.LOG_PAGE_SIZE + 1),
+            on_results=self.on_log_search_results,
+            on_cleared=self.on_log_search_cleared,
+            refine=self.refine_log_search,
+            parent=self,
+        )
 
         # Add pages to stacked layout
         self.stacked_layout.addWidget(self.welcome_widget)
         self.stacked_layout.addWidget(self.inventory_widget)
         self.stacked_layout.addWidget(self.log_widget)
+        self.init_performance_view()
 
         # Show welcome page by default
         self.stacked_layout.setCurrentWidget(self.welcome_widget)
@@ -294,6 +445,48 @@ class InventoryApp(QMainWindow):
         self.load_logs()
 
 
+    def init_performance_view(self):
+        """Hidden page with the recorded timers and counters, opened with Ctrl+Shift+P."""
+        self.performance_widget = QWidget()
+        performance_layout = QVBoxLayout()
+        self.performance_widget.setLayout(performance_layout)
+
+        controls = QHBoxLayout()
+        self.metrics_checkbox = QCheckBox(self.t["metrics_enabled"])
+        self.metrics_checkbox.setChecked(Metrics.ENABLED)
+        self.metrics_checkbox.toggled.connect(self.set_metrics_enabled)
+        self.metrics_refresh_button = QPushButton(self.t["refresh"])
+        self.metrics_refresh_button.clicked.connect(self.refresh_performance_view)
+        self.metrics_reset_button = QPushButton(self.t["reset"])
+        self.metrics_reset_button.clicked.connect(self.reset_metrics)
+        self.metrics_dump_button = QPushButton(self.t["dump_metrics"])
+        self.metrics_dump_button.clicked.connect(self.dump_metrics_dialog)
+        for button in (self.metrics_refresh_button, self.metrics_reset_button, self.metrics_dump_button):
+            WidgetStyle.setDefaultStyle(button)
+        controls.addWidget(self.metrics_checkbox)
+        controls.addStretch()
+        controls.addWidget(self.metrics_refresh_button)
+        controls.addWidget(self.metrics_reset_button)
+        controls.addWidget(self.metrics_dump_button)
+
+        self.metrics_text = QPlainTextEdit()
+        self.metrics_text.setReadOnly(True)
+        self.metrics_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.metrics_text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+
+        performance_layout.addLayout(controls)
+        performance_layout.addWidget(self.metrics_text)
+        self.stacked_layout.addWidget(self.performance_widget)
+
+        # Refresh once a second while the page is shown
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(1000)
+        self.metrics_timer.timeout.connect(self.refresh_performance_view)
+        self.stacked_layout.currentChanged.connect(self.on_page_changed)
+
+        self.performance_shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
+        self.performance_shortcut.activated.connect(self.show_performance_view)
+
     # -------------------------
     # Page Switching
     # -------------------------
@@ -306,96 +499,318 @@ class InventoryApp(QMainWindow):
     def show_log_view(self):
         self.stacked_layout.setCurrentWidget(self.log_widget)
 
+    def show_performance_view(self):
+        self.stacked_layout.setCurrentWidget(self.performance_widget)
+
+    def on_page_changed(self, index):
+        if self.stacked_layout.widget(index) is self.performance_widget:
+            self.refresh_performance_view()
+            self.metrics_timer.start()
+        else:
+            self.metrics_timer.stop()
+
     # -------------------------
-    # Data Handling
+    # Performance Metrics
     # -------------------------
-    def get_data(self):
-        print(self.data)
-        self.data = SQLManager.singleton().select_items()
-        print(self.data)
-        if self.data is None: self.data = []
-        print(self.data)
+    def set_metrics_enabled(self, enabled):
+        Metrics.enable(enabled)
+        Config.singleton().set("metrics", "1" if enabled else "0")
+        self.refresh_performance_view()
+
+    def refresh_performance_view(self):
+        scroll = self.metrics_text.verticalScrollBar().value()
+        self.metrics_text.setPlainText(Metrics.format_table())
+        self.metrics_text.verticalScrollBar().setValue(scroll)
+
+    def reset_metrics(self):
+        Metrics.reset()
+        self.refresh_performance_view()
+
+    def dump_metrics_dialog(self):
+        """Save the current snapshot to a JSON file."""
+        path, _ = QFileDialog.getSaveFileName(self, self.t["dump_metrics"], "metrics.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            Metrics.dump(path)
+            self.statusBar().showMessage(self.t["metrics_saved"].format(file=Path(path).name))
+        except OSError as e:
+            print(f"Error saving metrics: {e}")
 
+    # -------------------------
+    # Data Handling
+    # -------------------------
     def update_table(self):
-        self.get_data()
-        self.populate_table(self.data)
+        """Bring the items up to date on the database worker: only the changes, once a full load was done."""
+        mark = self.item_mark
+
+        def sync():
+            result = SQLManager.singleton().sync_items(mark)
+            if result is None:
+                return None
+            new_mark, rows, deleted = result
+            # A full load is turned into a store on the worker too, so the GUI thread only swaps it in
+            return new_mark, (ItemStore(rows) if deleted is None else rows), deleted
+
+        DatabaseWorker.singleton().submit(sync, on_result=self.on_items_synced)
 
-    def populate_table(self, data, location=None):
-        if location is None:
-            location = self.table
-        location.blockSignals(True)
-        location.setRowCount(len(data))
-        for row, (id, name, code, qty) in enumerate(data):
-            name_item = QTableWidgetItem(name)
-            code_item = QTableWidgetItem(code)
-            qty_item = QTableWidgetItem(str(qty))
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            code_item.setFlags(code_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            location.setItem(row, 0, name_item)
-            location.setItem(row, 1, code_item)
-            location.setItem(row, 2, qty_item)
-        location.blockSignals(False)
-
-    def on_table_item_changed(self, item: QTableWidgetItem):
-        row, col = item.row(), item.column()
-        if col != 2:
+    def on_items_synced(self, result):
+        if result is None:
             return
-        edited_code = self.table.item(row, 1).text()
-        try:
-            new_qty = int(item.text())
-            if new_qty < 0:
-                raise ValueError
-        except ValueError:
-            old_qty = next(qty for name, code, qty in self.data if code == edited_code)
-            self.table.blockSignals(True)
-            self.table.item(row, col).setText(str(old_qty))
-            self.table.blockSignals(False)
+        mark, rows, deleted = result
+        if deleted is None:
+            self.item_mark = mark
+            self.change_feed.follow(mark)
+            self.on_items_loaded(rows)
+            return
+        if mark[0] != (self.item_mark or (None,))[0]:
+            return  # computed for rows that a full load from another database has since replaced
+        self.item_mark = mark
+        self.change_feed.follow(mark)
+        self.apply_item_changes(rows, deleted)
+
+    def apply_item_changes(self, rows, deleted):
+        """Apply items changed (added or updated) and removed elsewhere to the cache and the view."""
+        for item_id in deleted:
+            self.apply_item_delete(item_id)
+        inserted = False
+        for id, name, code, qty in rows:
+            # Keep scans that are still queued visible on top of the server value
+            item = (id, name, code, qty + self.scan_pipeline.pending_delta(code))
+            if self.data.find(id) is None:
+                self.apply_item_insert(item)
+                inserted = True
+            else:
+                self.apply_item_update(item)
+        if inserted and self.item_search.term:
+            self.item_search.refresh()
+
+    def on_items_loaded(self, store):
+        self.data = store
+        self.populate_table(self.data)
+        if self.item_search.term:
+            self.item_search.refresh()
+
+    @Metrics.timed("ui populate_table")
+    def populate_table(self, data: ItemStore):
+        """Point the table model at an item store; cells are read lazily by the view."""
+        self.table_model.set_store(data)
+
+    def on_table_item_changed(self, item_id: int, new_qty: int):
+        """Persist a quantity edited in the table or the search results (already validated)."""
+        row = self.find_row(item_id)
+        if row is None:
             return
-        for i, (id, name, code, qty) in enumerate(self.data):
-            if code == edited_code:
-                self.data[i] = (id, name, code, str(new_qty))
-                SQLManager.singleton().update_item(id, name, code, new_qty)
+        old_item = self.data[row]
+        id, name, code, qty = old_item
+        # Show the new value right away and roll it back if the write fails
+        self.apply_item_update((id, name, code, new_qty))
+
+        def write():
+            # The update and its log entry commit together
+            sql = SQLManager.singleton()
+            with sql.transaction():
+                sql.update_item(id, name, code, new_qty)
                 Logger.log(self.t["product_updated"].format(name=name, qty=new_qty))
-                self.load_logs()
-                break
-
-    def search_items(self):
-        term = self.search_input.text().strip().lower()
-        filtered = [item for item in self.data if term in item[0].lower() or term in item[1]]
-        self.populate_table(filtered)
-
-    def add_data_row(self, name: str, code: str, qty: int | str = 0):
-        row = (name, code, str(qty))
-        self.data.append(row)
-        Logger.log(self.t["product_added"].format(name=name,code=code, qty=qty))
-        self.load_logs()
-        SQLManager.singleton().add_item(name, code, qty)
-        self.update_table()
+
+        def on_error(error):
+            print(f"Error updating item: {error}")
+            self.apply_item_update(old_item)
+
+        DatabaseWorker.singleton().submit(write, on_error=on_error)
+
+    def on_scans_flushed(self, rows, batch):
+        """Replace optimistic scan quantities with the values committed on the server."""
+        for id, name, code, qty in rows:
+            # Keep scans queued after this flush visible on top of the server value
+            self.apply_item_update((id, name, code, int(qty) + self.scan_pipeline.pending_delta(code)))
+            Logger.log(self.t["product_scanned"].format(name=name, qty=batch[code], new_qty=qty))
+
+    def closeEvent(self, event):
+        """Persist queued scans before the window closes."""
+        self.scan_pipeline.flush(wait=True)
+        Logger.remove_listener(self.logsWritten.emit)
+        self.change_feed.stop()
+        super().closeEvent(event)
+
+    ITEM_SEARCH_LIMIT = 500
+
+    @Metrics.timed("ui show_item_search")
+    def on_search_items(self, term, ids):
+        """Show the items found for term, ranked as search_items returned them."""
+        # The hits are IDs; the rows themselves come from the cache so edits stay in sync
+        self.search_model.set_store(self.data.subset(ids))
+        self.table.setModel(self.search_model)
+
+    def on_search_items_cleared(self):
+        self.search_model.set_store(ItemStore())
+        self.table.setModel(self.table_model)
+
+    def refine_item_search(self, old_term, ids, term):
+        """Narrow the previous hits to term without a query, or return None when they are incomplete."""
+        if len(ids) >= self.ITEM_SEARCH_LIMIT:
+            return None
+        old_term, term = old_term.lower(), term.lower()
+        rows = list(self.data.subset(ids))
+        # Fuzzy hits do not contain the old term, so they say nothing about what matches the new one
+        if not all(old_term in name.lower() or old_term in code.lower() for id, name, code, qty in rows):
+            return None
+        rows = [item for item in rows if term in item[1].lower() or term in item[2].lower()]
+        if not rows:
+            return None  # let the database look for fuzzy matches
+        # Same ranking as the database: code prefixes, then name prefixes, then the rest
+        rows.sort(key=lambda item: (not item[2].lower().startswith(term), not item[1].lower().startswith(term)))
+        return [item[0] for item in rows]
+
+    def add_data_row(self, name: str, code: str, qty: int | str = 0, on_done=None):
+        """Insert an item on the database worker; on_done(success) is called on the GUI thread."""
+        def write():
+            # The insert and its log entry commit together
+            sql = SQLManager.singleton()
+            with sql.transaction():
+                item_id = sql.add_item(name, code, qty)
+                Logger.log(self.t["product_added"].format(name=name,code=code, qty=qty))
+            return item_id
+
+        def on_result(item_id):
+            self.apply_item_insert((item_id, name, code, int(qty)))
+            if on_done is not None:
+                on_done(True)
+
+        def on_error(error):
+            print(f"Error adding item: {error}")
+            if on_done is not None:
+                on_done(False)
+
+        DatabaseWorker.singleton().submit(write, on_result=on_result, on_error=on_error)
+
+    # -------------------------
+    # Incremental Updates
+    # -------------------------
+    def find_row(self, item_id):
+        """Return the position of an item in self.data, or None."""
+        return self.data.find(item_id)
+
+    def find_row_by_code(self, code):
+        """Return the position of the item with this product code, or None."""
+        return self.data.find_code(code)
+
+    def apply_item_insert(self, item):
+        """Add a freshly inserted item to the cache and the view."""
+        if self.data.find(item[0]) is not None:
+            # The change feed may have delivered it before the insert's own result
+            self.apply_item_update(item)
+            return
+        self.table_model.append_row(item)
+
+    def apply_item_update(self, item):
+        """Replace a cached item (matched by ID) and repaint its row only."""
+        row = self.data.find(item[0])
+        if row is None:
+            return
+        self.table_model.update_row(row, item)
+        row = self.search_model.store().find(item[0])
+        if row is not None:
+            self.search_model.update_row(row, item)
+
+    def apply_item_delete(self, item_id):
+        """Drop a cached item and its row."""
+        row = self.data.find(item_id)
+        if row is None:
+            return
+        self.table_model.remove_row(row)
+        row = self.search_model.store().find(item_id)
+        if row is not None:
+            self.search_model.remove_row(row)
 
     # -------------------------
     # Logs
     # -------------------------
+    LOG_PAGE_SIZE = 200
+
     def load_logs(self):
-        self.all_logs = SQLManager.singleton().select_logs()
-        self.populate_log_table(self.all_logs)
-
-    def populate_log_table(self, logs):
-        self.log_table.blockSignals(True)
-        self.log_table.setRowCount(len(logs))
-        for row, (id, user, timestamp, message) in enumerate(logs):
-            # convert datetime to string
-            timestamp_str = timestamp.strftime("%H:%M:%S %d-%m-%Y") if isinstance(timestamp, datetime.datetime) else str(timestamp)
-            self.log_table.setItem(row, 0, QTableWidgetItem(timestamp_str))
-            self.log_table.setItem(row, 1, QTableWidgetItem(str(message)))
-        self.log_table.blockSignals(False)
-
-    def filter_logs(self, text):
-        term = text.strip().lower()
-        if not term:
-            filtered = self.all_logs
-        else:
-            filtered = [log for log in self.all_logs if term in log[0].lower() or term in log[1].lower()]
-        self.populate_log_table(filtered)
+        """Reload the log view with the newest page of entries."""
+        self.log_generation += 1
+        generation = self.log_generation
+        DatabaseWorker.singleton().submit(
+            lambda: SQLManager.singleton().select_logs_page(limit=self.LOG_PAGE_SIZE + 1),
+            on_result=lambda logs: self.on_logs_loaded(generation, logs),
+        )
+
+    @Metrics.timed("ui populate_log_table")
+    def on_logs_loaded(self, generation, logs):
+        if generation != self.log_generation:
+            return
+        logs = logs or []
+        # One extra row was requested only to learn whether an older page exists
+        self.log_model.set_rows(logs[:self.LOG_PAGE_SIZE], has_more=len(logs) > self.LOG_PAGE_SIZE)
+
+    def load_older_logs(self):
+        """Fetch the page below the oldest loaded entry (keyset on timestamp, id)."""
+        generation = self.log_generation
+        before = self.log_model.oldest_key()
+        DatabaseWorker.singleton().submit(
+            lambda: SQLManager.singleton().select_logs_page(before=before, limit=self.LOG_PAGE_SIZE + 1),
+            on_result=lambda logs: self.on_older_logs_loaded(generation, logs),
+        )
+
+    def on_older_logs_loaded(self, generation, logs):
+        if generation != self.log_generation:
+            return
+        logs = logs or []
+        self.log_model.append_older(logs[:self.LOG_PAGE_SIZE], has_more=len(logs) > self.LOG_PAGE_SIZE)
+
+    def load_new_logs(self):
+        """Add entries written since the newest one on screen."""
+        generation = self.log_generation
+        after_id = self.log_model.newest_id() or 0
+        DatabaseWorker.singleton().submit(
+            lambda: SQLManager.singleton().select_logs_after(after_id),
+            on_result=lambda logs: self.on_new_logs_loaded(generation, logs),
+        )
+
+    def on_new_logs_loaded(self, generation, logs):
+        if generation == self.log_generation and logs:
+            self.log_model.prepend_newer(logs)
+
+    @Metrics.timed("ui show_log_search")
+    def on_log_search_results(self, term, logs):
+        """Show the first page of full-text hits in place of the paged log."""
+        self.log_search_model.set_rows(logs[:self.LOG_PAGE_SIZE], has_more=len(logs) > self.LOG_PAGE_SIZE)
+        self.log_table.setModel(self.log_search_model)
+
+    def on_log_search_cleared(self):
+        self.log_search_model.set_rows([])
+        self.log_table.setModel(self.log_model)
+
+    def refine_log_search(self, old_term, logs, term):
+        """Narrow a complete set of hits to term locally, matching words by prefix like the index does."""
+        if len(logs) > self.LOG_PAGE_SIZE:
+            return None
+        words = re.findall(r"\w+", term.lower())
+        if not words:
+            return None
+
+        def matches(entry):
+            tokens = re.findall(r"\w+", f"{entry[1]} {entry[3]}".lower())
+            return all(any(token.startswith(word) for token in tokens) for word in words)
+
+        return [entry for entry in logs if matches(entry)]
+
+    def load_more_search_results(self):
+        generation, term = self.log_search.generation, self.log_search.term
+        offset = self.log_search_model.rowCount()
+        DatabaseWorker.singleton().submit_job(
+            lambda: SQLManager.singleton().search_logs(term, limit=self.LOG_PAGE_SIZE + 1, offset=offset),
+            on_result=lambda logs: self.on_search_results(generation, logs),
+        )
+
+    def on_search_results(self, generation, logs):
+        # Drop results for a term the user has already changed
+        if generation != self.log_search.generation:
+            return
+        logs = logs or []
+        self.log_search_model.append_older(logs[:self.LOG_PAGE_SIZE], has_more=len(logs) > self.LOG_PAGE_SIZE)
 
     # -------------------------
     # Language Change
@@ -422,6 +837,9 @@ class InventoryApp(QMainWindow):
         self.edit_item_action.setText(self.t["edit_item"])
         self.remove_item_action.setText(self.t["remove_item"])
         self.view_all_action.setText(self.t["view_all"])
+        self.import_action.setText(self.t["import_items"])
+        self.export_items_action.setText(self.t["export_items"])
+        self.export_logs_action.setText(self.t["export_logs"])
         self.view_logs_action.setText(self.t["logs"])
         self.settings_menu.setTitle(self.t["settings"])
         self.language_menu.setTitle(self.t["language"])
@@ -450,8 +868,16 @@ class InventoryApp(QMainWindow):
 
         # --- Log Viewer Page ---
         self.log_search_input.setPlaceholderText(self.t["search_placeholder"])
-        self.log_table.setHorizontalHeaderLabels([self.t["timestamp"], self.t["message"]])
+        self.log_model.set_headers([self.t["timestamp"], self.t["message"]])
+        self.log_search_model.set_headers([self.t["timestamp"], self.t["message"]])
+
+        # --- Performance Page ---
+        self.metrics_checkbox.setText(self.t["metrics_enabled"])
+        self.metrics_refresh_button.setText(self.t["refresh"])
+        self.metrics_reset_button.setText(self.t["reset"])
+        self.metrics_dump_button.setText(self.t["dump_metrics"])
 
         # --- Table headers ---
-        self.table.setHorizontalHeaderLabels([self.t["name"], self.t["code"], self.t["quantity"]])
-        SQLManager.save_config("language", self.lang)
\ No newline at end of file
+        self.table_model.set_headers([self.t["name"], self.t["code"], self.t["quantity"]])
+        self.search_model.set_headers([self.t["name"], self.t["code"], self.t["quantity"]])
+        Config.singleton().set("language", self.lang)
\ No newline at end of file
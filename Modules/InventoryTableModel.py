@@ -0,0 +1,233 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+from array import array
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    pyqtSignal,
+)
+from Modules.ItemStore import ItemStore
+
+class InventoryTableModel(QAbstractTableModel):
+    """Table model that reads inventory rows on demand instead of creating a widget item per cell.
+
+    Sorting keeps a permutation of store rows (ascending by the sort column, read backwards for a
+    descending sort) built straight from the store's columns; a QSortFilterProxyModel would compare
+    rows through data() and take seconds on every reset of a large catalogue.
+    """
+
+    # Emitted with (item ID, new quantity) when the user edits a quantity cell
+    quantityEdited = pyqtSignal(int, int)
+
+    NAME, CODE, QTY = range(3)
+
+    def __init__(self, store=None, headers=None, parent=None):
+        super().__init__(parent)
+        self._store = store if store is not None else ItemStore()
+        self._headers = headers or ["", "", ""]
+        self._sort_column = None  # None keeps the store's order
+        self._descending = False
+        self._order = None        # store rows in ascending sort order, when sorted
+
+    # -------------------------
+    # Data Source
+    # -------------------------
+    def set_store(self, store: ItemStore):
+        """Swap in a new item store; only the visible cells are materialized afterwards."""
+        self.beginResetModel()
+        self._store = store
+        self._order = self._sorted_rows()
+        self.endResetModel()
+
+    def store(self) -> ItemStore:
+        return self._store
+
+    def refresh_row(self, row):
+        """Repaint a single (store) row after its values changed."""
+        view_row = self.view_row(row)
+        self.dataChanged.emit(self.index(view_row, 0), self.index(view_row, self.columnCount() - 1))
+
+    def append_row(self, item):
+        """Insert one (id, name, code, qty) row without resetting the model (in sort order when sorted)."""
+        row = len(self._store)
+        if self._order is None:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._store.append(item)
+            self.endInsertRows()
+            return
+        position = self._insertion_point(self._sort_key(item))
+        view_row = self._to_view(position, len(self._order) + 1)
+        self.beginInsertRows(QModelIndex(), view_row, view_row)
+        self._store.append(item)
+        self._order.insert(position, row)
+        self.endInsertRows()
+
+    def update_row(self, row, item):
+        """Replace the values at (store) row; repaint it, or move it when its sort value changed."""
+        old_key = self._sort_key(self._store[row]) if self._order is not None else None
+        self._store.update(row, item)
+        if self._order is None or self._sort_key(item) == old_key:
+            self.refresh_row(row)
+            return
+        count = len(self._order)
+        position = self._order.index(row)
+        del self._order[position]
+        new_position = self._insertion_point(self._sort_key(item))
+        self._order.insert(position, row)  # back until the view has been told about the move
+        source, target = self._to_view(position, count), self._to_view(new_position, count)
+        if source == target:
+            self.refresh_row(row)
+            return
+        # Qt counts the destination in rows before the move
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), target + 1 if target > source else target)
+        del self._order[position]
+        self._order.insert(new_position, row)
+        self.endMoveRows()
+        self.refresh_row(row)
+
+    def remove_row(self, row):
+        """Remove a row in O(1) by moving the last row into its slot (the sort order keeps display order)."""
+        last = len(self._store) - 1
+        if self._order is not None:
+            view_row = self.view_row(row)
+            self.beginRemoveRows(QModelIndex(), view_row, view_row)
+            del self._order[self._order.index(row)]
+            if row != last:
+                # The item in the last slot moves to row; its place in the order stays
+                self._order[self._order.index(last)] = row
+                self._store.swap(row, last)
+            self._store.pop()
+            self.endRemoveRows()
+            return
+        if row != last:
+            self._store.swap(row, last)
+            self.refresh_row(row)
+        self.beginRemoveRows(QModelIndex(), last, last)
+        self._store.pop()
+        self.endRemoveRows()
+
+    # -------------------------
+    # Sorting
+    # -------------------------
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Order the view by a column; called by the view when a header is clicked."""
+        self.layoutAboutToBeChanged.emit([], QAbstractTableModel.LayoutChangeHint.VerticalSortHint)
+        persistent = self.persistentIndexList()
+        rows = [self.store_row(index.row()) for index in persistent]
+        self._sort_column = column if 0 <= column < self.columnCount() else None
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self._order = self._sorted_rows()
+        self.changePersistentIndexList(
+            persistent, [self.index(self.view_row(row), index.column()) for row, index in zip(rows, persistent)]
+        )
+        self.layoutChanged.emit([], QAbstractTableModel.LayoutChangeHint.VerticalSortHint)
+
+    def store_row(self, view_row):
+        """The store row shown at a view row."""
+        if self._order is None:
+            return view_row
+        return self._order[len(self._order) - 1 - view_row if self._descending else view_row]
+
+    def view_row(self, row):
+        """The view row showing a store row."""
+        if self._order is None:
+            return row
+        return self._to_view(self._order.index(row), len(self._order))
+
+    def _to_view(self, position, count):
+        return count - 1 - position if self._descending else position
+
+    def _column(self):
+        return (self._store.names, self._store.codes, self._store.qtys)[self._sort_column]
+
+    def _sort_key(self, item):
+        key = item[1 + self._sort_column]
+        return int(key) if self._sort_column == self.QTY else key
+
+    def _sorted_rows(self):
+        if self._sort_column is None:
+            return None
+        column = self._column()
+        # The sort runs in C over the column itself; no per-row Python calls or Qt variants
+        return array("q", sorted(range(len(column)), key=column.__getitem__))
+
+    def _insertion_point(self, key):
+        """Position in the order after every row whose sort value is <= key."""
+        column = self._column()
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            if key < column[self._order[middle]]:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def set_headers(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self._headers) - 1)
+
+    # -------------------------
+    # Qt Model Interface
+    # -------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 3
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            row = self.store_row(index.row())
+            column = index.column()
+            if column == self.NAME:
+                return self._store.names[row]
+            if column == self.CODE:
+                return self._store.codes[row]
+            return self._store.qtys[row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return section + 1
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.QTY:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Validate a quantity edit and hand it to the application through quantityEdited."""
+        if role != Qt.ItemDataRole.EditRole or not index.isValid() or index.column() != self.QTY:
+            return False
+        try:
+            new_qty = int(value)
+            if new_qty < 0:
+                raise ValueError
+        except (TypeError, ValueError):
+            # Rejecting the edit keeps the old value displayed
+            return False
+        self.quantityEdited.emit(self._store.id(self.store_row(index.row())), new_qty)
+        return True
+
@@ -0,0 +1,149 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import sys
+from array import array
+
+class ItemStore:
+    """Inventory rows kept column by column, with id and code lookups.
+
+    Ids and quantities live in array('q') columns (8 bytes each instead of a tuple plus int objects);
+    names are interned, so the many items sharing a name share one string (codes are unique, and
+    interning them would only add an entry per item to the interpreter's table). Rows are addressed
+    by position; removing one moves the last row into its place.
+    """
+
+    __slots__ = ("ids", "names", "codes", "qtys", "_by_id", "_by_code")
+
+    def __init__(self, items=()):
+        """Build the store from (id, name, code, qty) rows."""
+        columns = tuple(zip(*items)) or ((), (), (), ())
+        ids, names, codes, qtys = columns
+        self.ids = array("q", ids)
+        self.names = list(map(sys.intern, names))
+        self.codes = list(codes)
+        self.qtys = array("q", map(int, qtys))
+        self._by_id = dict(zip(ids, range(len(ids))))
+        self._by_code = dict(zip(self.codes, range(len(ids))))
+
+    # -------------------------
+    # Reading
+    # -------------------------
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, row) -> tuple:
+        """The row as an (id, name, code, qty) tuple."""
+        return self.ids[row], self.names[row], self.codes[row], self.qtys[row]
+
+    def __iter__(self):
+        return zip(self.ids, self.names, self.codes, self.qtys)
+
+    def id(self, row) -> int:
+        return self.ids[row]
+
+    def name(self, row) -> str:
+        return self.names[row]
+
+    def code(self, row) -> str:
+        return self.codes[row]
+
+    def qty(self, row) -> int:
+        return self.qtys[row]
+
+    def find(self, item_id):
+        """Return the row of an item, or None."""
+        return self._by_id.get(item_id)
+
+    def find_code(self, code):
+        """Return the row of the item with this product code, or None."""
+        return self._by_code.get(code)
+
+    def subset(self, item_ids):
+        """A new store with the given items in the given order (unknown ids are skipped)."""
+        rows = [self._by_id[item_id] for item_id in item_ids if item_id in self._by_id]
+        return ItemStore([self[row] for row in rows])
+
+    # -------------------------
+    # Writing
+    # -------------------------
+    def append(self, item) -> int:
+        """Add an (id, name, code, qty) row at the end and return its position."""
+        item_id, name, code, qty = item
+        if item_id in self._by_id:
+            raise ValueError(f"Item {item_id} is already in row {self._by_id[item_id]}")
+        row = len(self.ids)
+        self.ids.append(item_id)
+        self.names.append(sys.intern(name))
+        self.codes.append(code)
+        self.qtys.append(int(qty))
+        self._by_id[item_id] = row
+        self._by_code[code] = row
+        return row
+
+    def update(self, row, item):
+        """Replace the name, code and quantity at row; the id must stay the same."""
+        item_id, name, code, qty = item
+        if self.ids[row] != item_id:
+            raise ValueError(f"Row {row} holds item {self.ids[row]}, not {item_id}")
+        if self.codes[row] != code:
+            self._release_code(row)
+            self.codes[row] = code
+            self._by_code[code] = row
+        self.names[row] = sys.intern(name)
+        self.qtys[row] = int(qty)
+
+    def set_qty(self, row, qty):
+        self.qtys[row] = int(qty)
+
+    def swap(self, a, b):
+        """Exchange two rows."""
+        if a == b:
+            return
+        for column in (self.ids, self.names, self.codes, self.qtys):
+            column[a], column[b] = column[b], column[a]
+        self._by_id[self.ids[a]] = a
+        self._by_id[self.ids[b]] = b
+        # Only move code entries that pointed at the swapped rows (see _release_code)
+        code_a, code_b = self._by_code.get(self.codes[a]), self._by_code.get(self.codes[b])
+        if code_a == b:
+            self._by_code[self.codes[a]] = a
+        if code_b == a:
+            self._by_code[self.codes[b]] = b
+
+    def pop(self) -> tuple:
+        """Remove and return the last row."""
+        item = self[-1]
+        self._release_code(len(self.ids) - 1)
+        for column in (self.ids, self.names, self.codes, self.qtys):
+            column.pop()
+        del self._by_id[item[0]]
+        return item
+
+    def remove(self, row) -> tuple:
+        """Remove a row in O(1) by moving the last row into its place."""
+        self.swap(row, len(self.ids) - 1)
+        return self.pop()
+
+    def _release_code(self, row):
+        """Drop the code lookup of a row that gives its code up.
+
+        Changes arrive one item at a time, so two rows can briefly share a code (one took it
+        before the other's rename arrived); the lookup follows the row that took it last.
+        """
+        code = self.codes[row]
+        if self._by_code.get(code) == row:
+            del self._by_code[code]
@@ -12,6 +12,15 @@ translations = {
         "edit_item": "Edit Item",
         "remove_item": "Remove Item",
         "view_all": "View All Items",
+        "import_items": "Import Items...",
+        "import_progress": "Importing... {rows} rows",
+        "import_done": "Imported {imported} items from {file} ({skipped} rows skipped)",
+        "import_failed": "Import failed: {error}",
+        "export_items": "Export Items...",
+        "export_logs": "Export Logs...",
+        "export_progress": "Exporting... {rows} rows",
+        "export_done": "Exported {rows} rows to {file}",
+        "export_failed": "Export failed: {error}",
         "search_placeholder": "Search items by name or code...",
         "scan_products": "Scan Products",
         "confirm": "Confirm",
@@ -23,6 +32,14 @@ translations = {
         "message": "Message",
         "search": "Search",
 
+        # Performance view (Ctrl+Shift+P)
+        "performance": "Performance",
+        "metrics_enabled": "Collect metrics",
+        "refresh": "Refresh",
+        "reset": "Reset",
+        "dump_metrics": "Save as JSON...",
+        "metrics_saved": "Metrics saved to {file}",
+
         # Settings
         "settings": "Settings",
         "language": "language",
@@ -40,6 +57,7 @@ translations = {
         "enter_product_code_feedback": "Please enter a product code!",
         "product_not_found": "Product code '{code}' not found!",
         "product_updated": "Updated '{name}' → {qty}",
+        "product_scanned": "Scanned '{name}' +{qty} → {new_qty}",
         "product_added": "Added item: {name} (Code: {code}) → Quantity: {qty}",
 
         # Item Added
@@ -47,6 +65,7 @@ translations = {
         "enter_name_feedback": "Please enter a product name.",
         "enter_code_feedback": "Please enter a product code.",
         "added_feedback": "Added: {name} (Code: {code}, Qty: {qty})",
+        "add_failed_feedback": "Could not add the item. Does the code already exist?",
         "confirm": "Confirm",
         "cancel": "Cancel",
 
@@ -66,6 +85,7 @@ translations = {
         "code_empty": "Code cannot be empty.",
         "item_updated": "Edited item: {old_name} ({old_code}) → {new_name} ({new_code}, Quantity: {new_qty})",
         "name_updated": "Name Updated: {new_name} ({new_code})",
+        "update_failed_feedback": "Could not save the item. Does the code already exist?",
 
         # Credits
         "credits": "Credits",
@@ -84,6 +104,7 @@ translations = {
         "feedback_empty": "",
         "test_success": "Connection successful ✅",
         "test_failed": "Connection failed ❌",
+        "connect_failed": "Could not connect: {error}",
     },
     "si": {
         # Main UI
@@ -98,6 +119,15 @@ translations = {
         "edit_item": "Uredi izdelek",
         "remove_item": "Odstrani izdelek",
         "view_all": "Prikaži vse izdelke",
+        "import_items": "Uvozi izdelke...",
+        "import_progress": "Uvažanje... {rows} vrstic",
+        "import_done": "Uvoženih {imported} izdelkov iz {file} ({skipped} vrstic preskočenih)",
+        "import_failed": "Uvoz ni uspel: {error}",
+        "export_items": "Izvozi izdelke...",
+        "export_logs": "Izvozi dnevnike...",
+        "export_progress": "Izvažanje... {rows} vrstic",
+        "export_done": "Izvoženih {rows} vrstic v {file}",
+        "export_failed": "Izvoz ni uspel: {error}",
         "search_placeholder": "Išči izdelke po imenu ali kodi...",
         "scan_products": "Skeniraj izdelke",
         "confirm": "Potrdi",
@@ -109,6 +139,14 @@ translations = {
         "message": "Sporočilo",
         "search": "Išči",
 
+        # Performance view (Ctrl+Shift+P)
+        "performance": "Zmogljivost",
+        "metrics_enabled": "Zbiraj meritve",
+        "refresh": "Osveži",
+        "reset": "Ponastavi",
+        "dump_metrics": "Shrani kot JSON...",
+        "metrics_saved": "Meritve shranjene v {file}",
+
         # Settings
         "settings": "Nastavitve",
         "language": "Jezik",
@@ -126,6 +164,7 @@ translations = {
         "enter_product_code_feedback": "Prosimo, vnesite kodo izdelka!",
         "product_not_found": "Koda izdelka '{code}' ni bila najdena!",
         "product_updated": "Posodobljeno '{name}' → {qty}",
+        "product_scanned": "Skenirano '{name}' +{qty} → {new_qty}",
         "product_added": "Dodano: {name} (Koda: {code}) → Količina: {qty}",
 
         # Item Added
@@ -133,6 +172,7 @@ translations = {
         "enter_name_feedback": "Vnesite ime izdelka.",
         "enter_code_feedback": "Prosimo, vnesite kodo izdelka.",
         "added_feedback": "Dodano: {name} (Koda: {code}, Količina: {qty})",
+        "add_failed_feedback": "Izdelka ni bilo mogoče dodati. Ali koda že obstaja?",
 
         # Item Removed
         "remove_item_title": "Odstrani izdelek",
@@ -150,6 +190,7 @@ translations = {
         "code_empty": "Koda ne sme biti prazna.",
         "item_updated": "Urejen Izdelek: {old_name} ({old_code}) → {new_name} ({new_code}, Količina: {new_qty})",
         "name_updated": "Ime Posodobljeno: {new_name} ({new_code})",
+        "update_failed_feedback": "Izdelka ni bilo mogoče shraniti. Ali koda že obstaja?",
 
         # Credits
         "credits": "Avtorji",
@@ -168,5 +209,6 @@ translations = {
         "feedback_empty": "",
         "test_success": "Povezava uspešna ✅",
         "test_failed": "Povezava neuspešna ❌",
+        "connect_failed": "Povezava ni uspela: {error}",
     }
 }
@@ -0,0 +1,122 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import datetime
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+class LogTableModel(QAbstractTableModel):
+    """Newest-first log model that grows at the top (new entries) and the bottom (older pages)."""
+
+    # Emitted when the view scrolls to the end and another page of older entries should be fetched
+    olderRequested = pyqtSignal()
+
+    TIMESTAMP, MESSAGE = range(2)
+
+    def __init__(self, headers=None, parent=None):
+        super().__init__(parent)
+        self._headers = headers or ["", ""]
+        # Two append-only lists keep both ends O(1):
+        #   _newer holds entries that arrived after the first page, oldest first
+        #   _older holds the first page and every older page, newest first
+        self._newer = []
+        self._older = []
+        self.has_more = False
+        self.loading = False
+
+    # -------------------------
+    # Data Source
+    # -------------------------
+    def set_rows(self, rows, has_more=False):
+        """Replace everything with a newest-first list (e.g. the first page)."""
+        self.beginResetModel()
+        self._newer = []
+        self._older = list(rows)
+        self.has_more = has_more
+        self.loading = False
+        self.endResetModel()
+
+    def append_older(self, rows, has_more):
+        """Add a page of older entries (newest first) below the loaded ones."""
+        self.loading = False
+        self.has_more = has_more
+        if not rows:
+            return
+        start = self.rowCount()
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._older.extend(rows)
+        self.endInsertRows()
+
+    def prepend_newer(self, rows):
+        """Add entries written since the last load (oldest first) above the loaded ones."""
+        newest = self.newest_id()
+        rows = [row for row in rows if newest is None or row[0] > newest]
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._newer.extend(rows)
+        self.endInsertRows()
+
+    def row_at(self, row):
+        if row < len(self._newer):
+            return self._newer[len(self._newer) - 1 - row]
+        return self._older[row - len(self._newer)]
+
+    def newest_id(self):
+        if self._newer:
+            return self._newer[-1][0]
+        return self._older[0][0] if self._older else None
+
+    def oldest_key(self):
+        """(timestamp, id) of the oldest loaded entry, used as the keyset cursor for the next page."""
+        oldest = self._older[-1] if self._older else (self._newer[0] if self._newer else None)
+        return None if oldest is None else (oldest[2], oldest[0])
+
+    def set_headers(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self._headers) - 1)
+
+    # -------------------------
+    # Qt Model Interface
+    # -------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._newer) + len(self._older)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        id, user, timestamp, message = self.row_at(index.row())
+        if index.column() == self.TIMESTAMP:
+            # convert datetime to string
+            return timestamp.strftime("%H:%M:%S %d-%m-%Y") if isinstance(timestamp, datetime.datetime) else str(timestamp)
+        return str(message)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return section + 1
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.has_more and not self.loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Called by the view when it scrolls to the bottom."""
+        self.loading = True
+        self.olderRequested.emit()
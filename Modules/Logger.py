@@ -16,34 +16,156 @@
 
 
 import csv
-import json
-import base64
+import time
+import queue
+import atexit
+import threading
 from pathlib import Path
 from datetime import datetime
+from Modules.Config import Config
 from Modules.SQLManager import SQLManager
+from Modules.Metrics import Metrics
+
+class LogWriter(threading.Thread):
+    """Background thread that drains queued log rows into the database in batches."""
+
+    def __init__(self, flush_interval=0.5, batch_size=200, max_queue=10000, put_timeout=1.0):
+        super().__init__(name="LogWriter", daemon=True)
+        self.flush_interval = flush_interval  # seconds a batch keeps collecting after its first row
+        self.batch_size = batch_size          # max rows per INSERT transaction
+        self.put_timeout = put_timeout        # how long log() may block when the queue is full
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.listeners = []                   # called (on this thread) after every written batch
+        self.dropped = 0
+        self._stop_event = threading.Event()
+
+    def submit(self, user_id, message):
+        """Queue one row; blocks up to put_timeout when full, then drops it (back-pressure)."""
+        try:
+            self.queue.put((user_id, message), timeout=self.put_timeout)
+        except queue.Full:
+            self.dropped += 1
+            Metrics.count("logger dropped")
+            print(f"Log queue full, dropped entry: {message}")
+
+    def run(self):
+        while not (self._stop_event.is_set() and self.queue.empty()):
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            # Keep collecting until the batch is full or flush_interval has passed since its first row;
+            # when stopping, only take what is already waiting
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining <= 0 or self._stop_event.is_set():
+                        batch.append(self.queue.get_nowait())
+                    else:
+                        batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.write(batch)
+        # Hand this thread's database connection back before exiting
+        SQLManager.singleton().release()
+
+    def write(self, batch):
+        try:
+            Metrics.count("logger entries", len(batch))
+            with Metrics.timer("logger write_batch"):
+                SQLManager.singleton().add_logs(batch)
+        except Exception as e:
+            print(f"Error writing log: {e}")
+        finally:
+            for _ in batch:
+                self.queue.task_done()
+        self.notify()
+
+    def notify(self):
+        """Tell the listeners that new rows were written."""
+        for listener in list(self.listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Error notifying log listener: {e}")
+
+    def flush(self):
+        """Block until every queued row has been written."""
+        self.queue.join()
+
+    def stop(self):
+        """Write the remaining rows and end the thread."""
+        self._stop_event.set()
+        self.join()
+
 
 class Logger:
+    WRITER = None  # Shared background writer, started on first use
+    SETTINGS = {"flush_interval": 0.5, "batch_size": 200, "max_queue": 10000, "put_timeout": 1.0}
+
     @staticmethod
-    def log(message: str, user_id="Server", FILE: Path = None):
-        try:
-            CONFIG_FILE = Path("data/config.json")
-            if not CONFIG_FILE.exists():
-                return None
+    def configure(**settings):
+        """Set writer options before the first log.
 
-            with CONFIG_FILE.open("r", encoding="utf-8") as f:
-                config = json.load(f)
+        A batch is written batch_size rows or flush_interval seconds after its first row, whichever
+        comes first; log() blocks up to put_timeout while max_queue rows are waiting.
+        """
+        Logger.SETTINGS.update(settings)
 
-            encoded_value = config.get("user")
-            if encoded_value is None:
-                return None
+    @staticmethod
+    def writer() -> LogWriter:
+        if Logger.WRITER is None:
+            Logger.WRITER = LogWriter(**Logger.SETTINGS)
+            Logger.WRITER.start()
+            atexit.register(Logger.shutdown)
+        return Logger.WRITER
+
+    @staticmethod
+    def add_listener(callback):
+        """Register a callback that runs on the writer thread after each batch is committed."""
+        Logger.writer().listeners.append(callback)
+
+    @staticmethod
+    def remove_listener(callback):
+        if Logger.WRITER is not None and callback in Logger.WRITER.listeners:
+            Logger.WRITER.listeners.remove(callback)
+
+    @staticmethod
+    @Metrics.timed("logger log")
+    def log(message: str, user_id="Server", FILE: Path = None):
+        sql = SQLManager.SELF
+        if sql is not None and sql.in_transaction():
+            # Part of the caller's unit of work: written now and committed (or rolled back) with it,
+            # so a failure propagates and undoes the rest of the transaction too
+            user_id = Config.singleton().get("user")
+            if user_id is not None:
+                sql.add_log(user_id, message)
+                Logger.writer().notify()
+            return None
 
-            # Decode value
-            user_id = base64.b64decode(encoded_value.encode()).decode()
+        try:
+            user_id = Config.singleton().get("user")
+            if user_id is None:
+                return None
 
-            SQLManager.singleton().add_log(user_id=user_id, message=message)
+            Logger.writer().submit(user_id, message)
         except Exception as e:
             print(f"Error writing log: {e}")
 
+    @staticmethod
+    def flush():
+        """Wait until all queued log entries are in the database."""
+        if Logger.WRITER is not None:
+            Logger.WRITER.flush()
+
+    @staticmethod
+    def shutdown():
+        """Flush pending entries and stop the writer thread."""
+        if Logger.WRITER is not None:
+            Logger.WRITER.stop()
+            Logger.WRITER = None
+
     @staticmethod
     def read(FILE: Path = None):
         try:
@@ -0,0 +1,188 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import nullcontext
+
+class Histogram:
+    """Latency histogram with power-of-two microsecond buckets (fixed size, O(1) to record)."""
+
+    BUCKETS = 40  # 2^39 us is about six days
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0] * Histogram.BUCKETS
+
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        # Bucket i holds durations below 2^i microseconds
+        self.buckets[min(int(seconds * 1_000_000).bit_length(), Histogram.BUCKETS - 1)] += 1
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples, in seconds."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min((1 << i) / 1_000_000, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "min_ms": round((self.min or 0.0) * 1000, 3),
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "buckets_us": {1 << i: count for i, count in enumerate(self.buckets) if count},
+        }
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        Metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """Process-wide timers and counters. While disabled every call returns after one flag check."""
+
+    ENABLED = os.environ.get("INVENTORY_METRICS", "") not in ("", "0")
+    LOCK = threading.Lock()  # the GUI, database worker, jobs and log writer all record
+    HISTOGRAMS = {}
+    COUNTERS = {}
+    STARTED = time.time()
+    _DISABLED = nullcontext()
+
+    @staticmethod
+    def enable(enabled=True):
+        Metrics.ENABLED = enabled
+
+    @staticmethod
+    def reset():
+        with Metrics.LOCK:
+            Metrics.HISTOGRAMS = {}
+            Metrics.COUNTERS = {}
+            Metrics.STARTED = time.time()
+
+    # -------------------------
+    # Recording
+    # -------------------------
+    @staticmethod
+    def record(name, seconds):
+        """Add one duration to the histogram called name."""
+        if not Metrics.ENABLED:
+            return
+        with Metrics.LOCK:
+            histogram = Metrics.HISTOGRAMS.get(name)
+            if histogram is None:
+                histogram = Metrics.HISTOGRAMS[name] = Histogram()
+            histogram.record(seconds)
+
+    @staticmethod
+    def count(name, amount=1):
+        if not Metrics.ENABLED:
+            return
+        with Metrics.LOCK:
+            Metrics.COUNTERS[name] = Metrics.COUNTERS.get(name, 0) + amount
+
+    @staticmethod
+    def timer(name):
+        """Context manager that times its block (a shared no-op while disabled)."""
+        if not Metrics.ENABLED:
+            return Metrics._DISABLED
+        return _Timer(name)
+
+    @staticmethod
+    def timed(name):
+        """Decorator that times every call of a function."""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not Metrics.ENABLED:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    Metrics.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    @staticmethod
+    def snapshot():
+        """Copy of everything recorded so far, as plain data."""
+        with Metrics.LOCK:
+            return {
+                "enabled": Metrics.ENABLED,
+                "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(Metrics.STARTED)),
+                "timers": {name: histogram.snapshot() for name, histogram in sorted(Metrics.HISTOGRAMS.items())},
+                "counters": dict(sorted(Metrics.COUNTERS.items())),
+            }
+
+    @staticmethod
+    def dump(path):
+        """Write the snapshot to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(Metrics.snapshot(), f, indent=4)
+
+    @staticmethod
+    def format_table():
+        """The snapshot as fixed-width text, slowest total first."""
+        snapshot = Metrics.snapshot()
+        lines = [f"{'timer':<60}{'count':>9}{'total ms':>12}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+        timers = sorted(snapshot["timers"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for name, stats in timers:
+            lines.append(
+                f"{name[:59]:<60}{stats['count']:>9}{stats['total_ms']:>12.1f}{stats['mean_ms']:>10.2f}"
+                f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}"
+            )
+        if snapshot["counters"]:
+            lines.append("")
+            lines.append(f"{'counter':<60}{'value':>9}")
+            for name, value in snapshot["counters"].items():
+                lines.append(f"{name[:59]:<60}{value:>9}")
+        return "\n".join(lines)
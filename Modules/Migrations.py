@@ -0,0 +1,261 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+class Migration:
+    """One schema change, with the statements for each dialect.
+
+    A step is either an SQL string or a callable taking the cursor (for DDL that needs a check first).
+    Optional migrations add features the app can run without (e.g. full-text search on a server without
+    the parser); when they fail the rest still run and they are retried on the next connect.
+    """
+
+    def __init__(self, version: int, description: str, sqlite=(), mysql=(), optional=False):
+        self.version = version
+        self.description = description
+        self.steps = {"sqlite": list(sqlite), "mysql": list(mysql)}
+        self.optional = optional
+
+
+def mysql_add_index(table, name, definition):
+    """Step that adds an index unless it exists (MySQL has no CREATE INDEX IF NOT EXISTS)."""
+    def step(cur):
+        cur.execute(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s",
+            (table, name),
+        )
+        if cur.fetchone()[0] == 0:
+            cur.execute(f"ALTER TABLE {table} ADD {definition}")
+    return step
+
+
+def mysql_add_column(table, name, definition):
+    """Step that adds a column unless it exists (MySQL DDL is not transactional, so a retry may find it)."""
+    def step(cur):
+        cur.execute(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s",
+            (table, name),
+        )
+        if cur.fetchone()[0] == 0:
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+    return step
+
+
+# -------------------------
+# Migrations (append only - never edit one that has shipped)
+# -------------------------
+MIGRATIONS = [
+    Migration(
+        1, "inventory and logs tables",
+        sqlite=[
+            """
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                code TEXT UNIQUE NOT NULL,
+                qty INTEGER NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                message TEXT NOT NULL
+            )
+            """,
+        ],
+        mysql=[
+            """
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INT PRIMARY KEY AUTO_INCREMENT,
+                name VARCHAR(255) NOT NULL,
+                code VARCHAR(255) UNIQUE NOT NULL,
+                qty INT NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS logs (
+                id INT PRIMARY KEY AUTO_INCREMENT,
+                user_id VARCHAR(255) NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                message VARCHAR(255) NOT NULL
+            )
+            """,
+        ],
+    ),
+    Migration(
+        2, "log indexes for paging by time and filtering by user",
+        sqlite=[
+            "CREATE INDEX IF NOT EXISTS idx_logs_timestamp_id ON logs (timestamp, id)",
+            "CREATE INDEX IF NOT EXISTS idx_logs_user_id ON logs (user_id)",
+        ],
+        mysql=[
+            mysql_add_index("logs", "idx_logs_timestamp_id", "INDEX idx_logs_timestamp_id (timestamp, id)"),
+            mysql_add_index("logs", "idx_logs_user_id", "INDEX idx_logs_user_id (user_id)"),
+        ],
+    ),
+    Migration(
+        3, "inventory name/code indexes for prefix search",
+        # NOCASE indexes let the case-insensitive LIKE 'term%' use a range scan
+        sqlite=[
+            "CREATE INDEX IF NOT EXISTS idx_inventory_name ON inventory (name COLLATE NOCASE)",
+            "CREATE INDEX IF NOT EXISTS idx_inventory_code ON inventory (code COLLATE NOCASE)",
+        ],
+        # code is already covered by its UNIQUE index
+        mysql=[
+            mysql_add_index("inventory", "idx_inventory_name", "INDEX idx_inventory_name (name)"),
+        ],
+    ),
+    Migration(
+        4, "full-text index on log messages and users",
+        sqlite=[
+            # External-content table: the text lives in logs, FTS5 only keeps the index
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts
+            USING fts5(message, user_id, content='logs', content_rowid='id')
+            """,
+            # Keep the index in sync with every insert/delete on logs
+            """
+            CREATE TRIGGER IF NOT EXISTS logs_fts_insert AFTER INSERT ON logs BEGIN
+                INSERT INTO logs_fts (rowid, message, user_id) VALUES (new.id, new.message, new.user_id);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS logs_fts_delete AFTER DELETE ON logs BEGIN
+                INSERT INTO logs_fts (logs_fts, rowid, message, user_id) VALUES ('delete', old.id, old.message, old.user_id);
+            END
+            """,
+            # Index the entries written before the FTS table existed
+            "INSERT INTO logs_fts (logs_fts) VALUES ('rebuild')",
+        ],
+        mysql=[
+            mysql_add_index("logs", "ft_logs_message_user", "FULLTEXT INDEX ft_logs_message_user (message, user_id)"),
+        ],
+        optional=True,
+    ),
+    Migration(
+        5, "substring index on inventory names and codes",
+        sqlite=[
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS inventory_fts
+            USING fts5(name, code, content='inventory', content_rowid='id', tokenize='trigram')
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS inventory_fts_insert AFTER INSERT ON inventory BEGIN
+                INSERT INTO inventory_fts (rowid, name, code) VALUES (new.id, new.name, new.code);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS inventory_fts_delete AFTER DELETE ON inventory BEGIN
+                INSERT INTO inventory_fts (inventory_fts, rowid, name, code) VALUES ('delete', old.id, old.name, old.code);
+            END
+            """,
+            # Quantity changes are the hot path, so only re-index when name or code change
+            """
+            CREATE TRIGGER IF NOT EXISTS inventory_fts_update AFTER UPDATE OF name, code ON inventory BEGIN
+                INSERT INTO inventory_fts (inventory_fts, rowid, name, code) VALUES ('delete', old.id, old.name, old.code);
+                INSERT INTO inventory_fts (rowid, name, code) VALUES (new.id, new.name, new.code);
+            END
+            """,
+            "INSERT INTO inventory_fts (inventory_fts) VALUES ('rebuild')",
+        ],
+        # The ngram parser indexes every 2-character sequence, so phrases match substrings
+        mysql=[
+            mysql_add_index(
+                "inventory", "ft_inventory_name_code",
+                "FULLTEXT INDEX ft_inventory_name_code (name, code) WITH PARSER ngram",
+            ),
+        ],
+        optional=True,
+    ),
+    Migration(
+        6, "inventory change times and tombstones for incremental refreshes",
+        sqlite=[
+            # ADD COLUMN cannot take an expression default; the triggers below stamp every write
+            "ALTER TABLE inventory ADD COLUMN updated_at TEXT NOT NULL DEFAULT ''",
+            "UPDATE inventory SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now')",
+            "CREATE INDEX IF NOT EXISTS idx_inventory_updated_at ON inventory (updated_at)",
+            """
+            CREATE TRIGGER IF NOT EXISTS inventory_touch_insert AFTER INSERT ON inventory BEGIN
+                UPDATE inventory SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = new.id;
+            END
+            """,
+            # Only fires for the data columns, so the stamp itself does not trigger it again
+            """
+            CREATE TRIGGER IF NOT EXISTS inventory_touch_update AFTER UPDATE OF name, code, qty ON inventory BEGIN
+                UPDATE inventory SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = new.id;
+            END
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS item_tombstones (
+                id INTEGER PRIMARY KEY,
+                deleted_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_item_tombstones_deleted_at ON item_tombstones (deleted_at)",
+        ],
+        mysql=[
+            mysql_add_column(
+                "inventory", "updated_at",
+                "DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)",
+            ),
+            mysql_add_index("inventory", "idx_inventory_updated_at", "INDEX idx_inventory_updated_at (updated_at)"),
+            """
+            CREATE TABLE IF NOT EXISTS item_tombstones (
+                id INT PRIMARY KEY,
+                deleted_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+                INDEX idx_item_tombstones_deleted_at (deleted_at)
+            )
+            """,
+        ],
+    ),
+    Migration(
+        7, "journal of changed items for the live change feed",
+        sqlite=[
+            """
+            CREATE TABLE IF NOT EXISTS changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id INTEGER NOT NULL,
+                changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_changes_changed_at ON changes (changed_at)",
+        ],
+        mysql=[
+            """
+            CREATE TABLE IF NOT EXISTS changes (
+                id BIGINT PRIMARY KEY AUTO_INCREMENT,
+                item_id INT NOT NULL,
+                changed_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+                INDEX idx_changes_changed_at (changed_at)
+            )
+            """,
+        ],
+    ),
+    Migration(
+        8, "indexes and triggers a bulk import took down",
+        sqlite=[
+            # The statements that restore them; connect runs whatever an interrupted import left here
+            "CREATE TABLE IF NOT EXISTS bulk_pending (name TEXT PRIMARY KEY, statement TEXT NOT NULL)",
+        ],
+    ),
+]
+
+# Features that depend on an optional migration having been applied
+LOG_FULLTEXT = 4
+ITEM_SUBSTRING = 5
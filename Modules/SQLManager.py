@@ -15,90 +15,375 @@
 #  - PyQt6 (GPLv3) for the graphical user interface
 #  - mysql-connect for database integration
 
+import re
+import csv
 import json
-import base64
+import time
 import sqlite3
+import itertools
+import threading
+import logging
+import functools
 import mysql.connector
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from mysql.connector import pooling
 from pathlib import Path
+from datetime import datetime, timedelta
+from Modules.Config import Config
+from Modules.Migrations import MIGRATIONS, LOG_FULLTEXT, ITEM_SUBSTRING
+from Modules.Dialect import SQLiteDialect, MySQLDialect
+from Modules.Metrics import Metrics
 
 class SQLManager:
     SELF = None  # This is the class-level singleton reference
+    SELF_LOCK = threading.Lock()  # The GUI, the database worker and the log writer may all ask for it
 
     @staticmethod
     def singleton():
         """Static method to return the singleton instance."""
-        if SQLManager.SELF is None:  # Check if the singleton has been created
-            SQLManager.SELF = SQLManager()  # Create it if it doesn't exist
-            SQLManager.singleton().config_connect() # Auto-Connect feature
+        with SQLManager.SELF_LOCK:
+            if SQLManager.SELF is None:  # Check if the singleton has been created
+                instance = SQLManager()  # Create it if it doesn't exist
+                instance.config_connect() # Auto-Connect feature
+                SQLManager.SELF = instance
         return SQLManager.SELF  # Return the singleton instance
 
+    POOL_SIZE = 5            # MySQL connections shared by the GUI, database worker and log writer
+    PING_INTERVAL = 30.0     # seconds a connection may sit idle before it is pinged again
+    RECONNECT_ATTEMPTS = 5
+    RECONNECT_DELAY = 0.2    # first backoff delay in seconds, doubled after every failed attempt
+    CONNECT_TIMEOUT = 3      # seconds to wait for the MySQL server before falling back to SQLite
+    SQLITE_FILE = Path("data/inventory.db")
+    SNAPSHOT_FILE = Path("data/cache.db")  # last inventory read from MySQL, shown while connecting
+    SQLITE_CACHE_SIZE = 32768          # KiB of page cache per SQLite connection
+    SQLITE_MMAP_SIZE = 256 * 1024**2   # bytes of the database file read through mmap
+    SQLITE_BUSY_TIMEOUT = 5000         # ms a writer waits for another writer's lock before failing
+    PREPARED_CACHE_SIZE = 64           # prepared cursors kept per MySQL connection
+    SLOW_QUERY_MS = 250                # statements slower than this are written to SLOW_QUERY_FILE
+    SLOW_QUERY_FILE = Path("data/slow_queries.log")
+    SLOW_QUERY_MAX_BYTES = 1024**2     # the file is rotated at this size ...
+    SLOW_QUERY_BACKUPS = 3             # ... keeping this many old ones
+    SYNC_OVERLAP = 5                   # seconds re-read by every sync, for writes that commit after their stamp
+    TOMBSTONE_DAYS = 30                # deleted item ids are kept this long for clients that sync incrementally
+    CHANGES_DAYS = 2                   # change journal entries are kept this long for the live change feed
+    PRUNE_INTERVAL = 3600              # seconds between a client's prunes of tombstones and journal entries
+    JOURNAL_CHUNK = 500                # product codes per journal INSERT ... SELECT
+    JOURNAL_REFRESH = 0                # journal item_id for "too many items changed to list; refresh"
+    MIGRATION_LOCK_TIMEOUT = 30        # seconds GET_LOCK waits for another client's migration ...
+    MIGRATION_LOCK_ATTEMPTS = 3        # ... this many times before connect gives up
+
     def __init__(self, HOST="", USER="", PASSWORD="", DATABASE="", PORT=3306):
-        self.connect(HOST, USER, PASSWORD, DATABASE, PORT)
+        # Guards switching backends; queries themselves run on per-thread connections
+        self.lock = threading.RLock()
+        self._local = threading.local()
+        self._generation = 0  # bumped on every connect so threads drop connections to the old backend
+        self._sqlite_connections = set()  # open SQLite connections, closed (and optimized) at exit
+        self.pool = None
+        self.mysql = False
+        self.dialect = SQLiteDialect()  # replaced on every connect
+        self.sqlite_file = None
+        self.source = None  # which database is connected; a sync mark is only valid for the same one
+        self._pruned_at = None  # time.monotonic() of the last prune_history
+        self.log_fts = False  # whether logs have a full-text index to search
+        self.item_fts = False  # whether inventory has a substring (trigram/ngram) index
+        self.slow_query_seconds = SQLManager.SLOW_QUERY_MS / 1000  # None turns the slow-query log off
+        self._slow_log = None
+        if HOST:
+            self.connect(HOST, USER, PASSWORD, DATABASE, PORT)
 
     def connect(self, HOST="", USER="", PASSWORD="", DATABASE="", PORT=3306):
-        try:
-            # Attempt MySQL connection
-            self.conn = mysql.connector.connect(
-                host=HOST,
-                port=PORT,
-                user=USER,
-                password=PASSWORD,
-                database=DATABASE
-            )
-            self.cur = self.conn.cursor()
-            # Create Tables if they don't exist (MySQL)
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS inventory (
-                    id INT PRIMARY KEY AUTO_INCREMENT,
-                    name VARCHAR(255) NOT NULL,
-                    code VARCHAR(255) UNIQUE NOT NULL,
-                    qty INT NOT NULL
-                )
-            """)
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS logs (
-                    id INT PRIMARY KEY AUTO_INCREMENT,
-                    user_id VARCHAR(255) NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    message VARCHAR(255) NOT NULL
+        with self.lock:
+            self._pruned_at = None
+            self.load_slow_query_threshold()
+            try:
+                # Attempt MySQL connection
+                pool = pooling.MySQLConnectionPool(
+                    pool_name=f"inventory_{id(self)}_{self._generation + 1}",
+                    pool_size=int(Config.singleton().get("pool_size") or SQLManager.POOL_SIZE),
+                    host=HOST,
+                    port=PORT,
+                    user=USER,
+                    password=PASSWORD,
+                    database=DATABASE,
+                    connection_timeout=int(Config.singleton().get("connect_timeout") or SQLManager.CONNECT_TIMEOUT)
                 )
-            """)
-            self.conn.commit()
-        except mysql.connector.Error as e:
-            print(f"MySQL connection failed: {e}, falling back to SQLite")
-            FILE = Path("data/inventory.db")
+                # Switch the whole backend before bumping the generation: other threads reconnect when
+                # they see the new generation, and must not find half of the old backend then
+                self.pool = pool
+                self.mysql = True
+                self.dialect = MySQLDialect()
+                self.source = f"mysql://{USER}@{HOST}:{PORT}/{DATABASE}"
+                self._generation += 1
+                self.migrate()
+            except mysql.connector.Error as e:
+                print(f"MySQL connection failed: {e}, falling back to SQLite")
+                self.connect_sqlite()
+
+    def connect_sqlite(self, FILE: Path = None):
+        """Use the local SQLite database."""
+        with self.lock:
+            self.release()
+            self._pruned_at = None
+            self.pool = None
+            self.mysql = False
+            self.dialect = SQLiteDialect()
+            self.load_slow_query_threshold()
+            FILE = FILE or SQLManager.SQLITE_FILE
 
             # Ensure the parent folder exists
             FILE.parent.mkdir(parents=True, exist_ok=True)
+            self.sqlite_file = FILE
+            self.source = f"sqlite:{FILE.resolve()}"
+            self._generation += 1  # last, as in connect()
+
+            # WAL lets readers (log viewer, exports, searches) run while a writer commits;
+            # the mode is stored in the database file, so setting it once here is enough
+            self.cur.execute("PRAGMA journal_mode = WAL")
+            self.cur.fetchall()
+            self.migrate()
+
+    def migrate(self):
+        """Apply the migrations this database has not seen yet, in version order."""
+        cur = self.cur
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description VARCHAR(255) NOT NULL,
+                applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self.conn.commit()
+        if self.mysql:
+            # Several clients may connect to the same server at once; only one migrates at a time
+            self._migration_lock(cur)
+        try:
+            cur.execute("SELECT version FROM schema_version")
+            applied = {row[0] for row in cur.fetchall()}
+            for migration in MIGRATIONS:
+                if migration.version in applied:
+                    continue
+                try:
+                    if not self.mysql:
+                        # SQLite DDL is transactional, so a failed migration leaves nothing behind
+                        cur.execute("BEGIN")
+                    for step in migration.steps[self.dialect.name]:
+                        if callable(step):
+                            step(cur)
+                        else:
+                            cur.execute(step)
+                    cur.execute(
+                        self.dialect.sql("INSERT INTO schema_version (version, description) VALUES (?, ?)"),
+                        (migration.version, migration.description),
+                    )
+                    self.conn.commit()
+                    applied.add(migration.version)
+                except Exception as e:
+                    self._rollback()
+                    if not migration.optional:
+                        raise
+                    # Retried on the next connect, e.g. after the server gains the missing feature
+                    print(f"Optional migration {migration.version} ({migration.description}) failed: {e}")
+        finally:
+            if self.mysql:
+                cur.execute("SELECT RELEASE_LOCK('inventory_schema')")
+                cur.fetchall()
+
+        self.log_fts = LOG_FULLTEXT in applied
+        self.item_fts = ITEM_SUBSTRING in applied
+        if not self.mysql:
+            self.restore_indexes()
+
+    @staticmethod
+    def _migration_lock(cur):
+        """Take the server's schema lock; raises when it cannot be had (migrating without it would race)."""
+        for attempt in range(SQLManager.MIGRATION_LOCK_ATTEMPTS):
+            cur.execute("SELECT GET_LOCK('inventory_schema', %s)", (SQLManager.MIGRATION_LOCK_TIMEOUT,))
+            acquired = cur.fetchall()[0][0]
+            if acquired == 1:
+                return
+            if acquired is None:
+                # NULL: the server could not take the lock at all, so waiting longer will not help
+                break
+            print(f"Waiting for another client's schema migration (attempt {attempt + 1})")
+        raise mysql.connector.errors.DatabaseError("Could not take the schema migration lock")
+
+    # ---------------
+    # Per-thread Connections
+    # ---------------
+
+    @property
+    def conn(self):
+        """The calling thread's connection, checked out (and health-checked) on demand."""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            self.release()
+            local.conn, generation = self._open_connection()
+            local.cur = local.conn.cursor()
+            local.generation = generation
+            local.last_used = time.monotonic()
+        elif self.mysql and time.monotonic() - local.last_used > SQLManager.PING_INTERVAL:
+            self._ensure_alive()
+        return local.conn
+
+    @property
+    def cur(self):
+        """The calling thread's cursor."""
+        self.conn  # make sure this thread has a live connection
+        return self._local.cur
+
+    def _open_connection(self):
+        """Open a connection to the current backend; returns it with the generation it belongs to.
+
+        The backend is read under the lock, which connect() holds while switching it, and a connection
+        opened while a reconnect completed is closed and opened again on the new backend.
+        """
+        while True:
+            with self.lock:
+                generation, pool, sqlite_file = self._generation, self.pool, self.sqlite_file
+                use_mysql = self.mysql
+            conn = self._open_mysql(pool) if use_mysql else self._open_sqlite(sqlite_file)
+            with self.lock:
+                if self._generation == generation:
+                    return conn, generation
+            self._close(conn)
+
+    @staticmethod
+    def _open_mysql(pool):
+        # Check a connection out of the pool, backing off exponentially while the server is unreachable
+        delay = SQLManager.RECONNECT_DELAY
+        for attempt in range(SQLManager.RECONNECT_ATTEMPTS):
+            try:
+                return pool.get_connection()
+            except mysql.connector.Error as e:
+                if attempt + 1 == SQLManager.RECONNECT_ATTEMPTS:
+                    raise
+                print(f"MySQL checkout failed: {e}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                delay *= 2
+
+    def _open_sqlite(self, sqlite_file):
+        """Open a tuned SQLite connection; sizes come from the config when set there."""
+        config = Config.singleton()
+        busy_timeout = int(config.get("sqlite_busy_timeout") or SQLManager.SQLITE_BUSY_TIMEOUT)
+        # Each thread only ever uses its own connection; other threads only close it at exit
+        conn = sqlite3.connect(sqlite_file, timeout=busy_timeout / 1000, check_same_thread=False)
+        # In WAL mode NORMAL only syncs at checkpoints: a commit no longer waits for the disk
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {busy_timeout}")
+        # Negative cache_size is in KiB rather than pages
+        conn.execute(f"PRAGMA cache_size = -{int(config.get('sqlite_cache_size') or SQLManager.SQLITE_CACHE_SIZE)}")
+        conn.execute(f"PRAGMA mmap_size = {int(config.get('sqlite_mmap_size') or SQLManager.SQLITE_MMAP_SIZE)}")
+        with self.lock:
+            self._sqlite_connections.add(conn)
+        return conn
+
+    def _close(self, conn):
+        if isinstance(conn, sqlite3.Connection):
+            with self.lock:
+                if conn not in self._sqlite_connections:
+                    return  # already closed at exit
+                self._sqlite_connections.discard(conn)
+            try:
+                # Lets SQLite refresh the statistics of tables whose queries would benefit from it
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"Error optimizing database: {e}")
+        conn.close()
+
+    def close(self):
+        """Close every SQLite connection that is still open; called once at exit."""
+        with self.lock:
+            connections = list(self._sqlite_connections)
+            self._generation += 1  # any thread still running reconnects instead of using a closed one
+        for conn in connections:
+            try:
+                self._close(conn)
+            except Exception as e:
+                print(f"Error closing connection: {e}")
+
+    def _prepared_cursor(self, statement):
+        """This thread's server-side prepared cursor for a statement, prepared on first use."""
+        local = self._local
+        self.conn  # a new connection starts with no prepared cursors
+        cursors = local.prepared
+        cur = cursors.pop(statement, None)
+        if cur is None:
+            if len(cursors) >= SQLManager.PREPARED_CACHE_SIZE:
+                # Evict the least recently used statement (dicts keep insertion order)
+                oldest = next(iter(cursors))
+                try:
+                    cursors.pop(oldest).close()
+                except Exception as e:
+                    print(f"Error closing prepared statement: {e}")
+            cur = self.conn.cursor(prepared=True)
+        cursors[statement] = cur
+        return cur
+
+    def _ensure_alive(self):
+        """Ping an idle connection and replace it when the server dropped it."""
+        local = self._local
+        try:
+            local.conn.ping(reconnect=False)
+            local.last_used = time.monotonic()
+        except mysql.connector.Error:
+            self.invalidate()
+            self.conn
+
+    def invalidate(self):
+        """Forget this thread's connection so the next query checks out a fresh one."""
+        self.release()
+        self._local.generation = None
+
+    def release(self):
+        """Return this thread's connection to the pool (or close it for SQLite)."""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        local.conn = local.cur = local.generation = local.last_cursor = None
+        # Returning a pooled connection resets its session, which frees its prepared statements
+        local.prepared = {}
+        if conn is not None:
+            try:
+                self._close(conn)
+            except Exception as e:
+                print(f"Error closing connection: {e}")
+
+    @contextmanager
+    def cancellable(self, cancelled: threading.Event):
+        """Skip this thread's statements once cancelled is set; on SQLite the running one is interrupted too."""
+        local = self._local
+        local.cancelled = cancelled
+        conn = self.conn
+        if not self.mysql:
+            # A true return value from the progress handler aborts the statement that is executing
+            conn.set_progress_handler(cancelled.is_set, 1000)
+        try:
+            yield
+        finally:
+            local.cancelled = None
+            if not self.mysql:
+                conn.set_progress_handler(None, 1000)
+
+    def _cancelled(self):
+        cancelled = getattr(self._local, "cancelled", None)
+        return cancelled is not None and cancelled.is_set()
 
-            self.conn = sqlite3.connect(FILE)
-            self.cur = self.conn.cursor()
-            # Create Tables if they don't exist (SQLite)
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS inventory (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    code TEXT UNIQUE NOT NULL,
-                    qty INTEGER NOT NULL
-                )
-            """)
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    message TEXT NOT NULL
-                )
-            """)
-            self.conn.commit()
-        
     def config_connect(self):
+        with self.lock:
+            self._config_connect()
+
+    def _config_connect(self):
+        config = Config.singleton()
+        if not config.get("host"):
+            # No server configured: skip the doomed MySQL attempt
+            self.connect_sqlite()
+            return
         self.connect(
-            SQLManager.load_config("host") or "",
-            SQLManager.load_config("user") or "",
-            SQLManager.load_config("password") or "",
-            SQLManager.load_config("database") or "",
-            SQLManager.load_config("port") or 3306
+            config.get("host") or "",
+            config.get("user") or "",
+            config.get("password") or "",
+            config.get("database") or "",
+            int(config.get("port") or 3306)
         )
 
 
@@ -111,7 +396,8 @@ class SQLManager:
                 port=PORT,
                 user=USER,
                 password=PASSWORD,
-                database=DATABASE
+                database=DATABASE,
+                connection_timeout=int(Config.singleton().get("connect_timeout") or SQLManager.CONNECT_TIMEOUT)
             )
                 
             if conn.is_connected():
@@ -122,112 +408,868 @@ class SQLManager:
             print(f"Error executing query: {e}")
             return False
 
-    def execute_query(self, query, params=None):
-        """Execute a query (insert, update, delete, or select) on the database."""
+    # ---------------
+    # Transactions
+    # ---------------
+
+    @contextmanager
+    def transaction(self):
+        """Run the statements of a with-block as one unit: one commit, or none of them on an exception.
+
+        Blocks nest; an inner block becomes a savepoint, so its failure only undoes its own statements.
+        Inside a transaction execute_query/execute_many raise instead of returning None, so the first
+        failing statement ends the block.
+        """
+        local = self._local
+        depth = getattr(local, "tx_depth", 0)
+        cur = self.cur
+        if depth == 0:
+            if not self.mysql:
+                cur.execute("BEGIN")
+            # MySQL runs with autocommit off, so the transaction begins with the first statement
+        else:
+            cur.execute(f"SAVEPOINT tx_{depth}")
+        local.tx_depth = depth + 1
         try:
-            self.cur.execute(query, params or ())
-            
-            # Commit **only for write queries**
-            if query.strip().lower().startswith(('insert', 'update', 'delete')):
+            yield self
+        except BaseException:
+            local.tx_depth = depth
+            if depth == 0:
+                self._rollback()
+            else:
+                try:
+                    cur.execute(f"ROLLBACK TO SAVEPOINT tx_{depth}")
+                    cur.execute(f"RELEASE SAVEPOINT tx_{depth}")
+                except Exception as e:
+                    print(f"Error rolling back to savepoint: {e}")
+            raise
+        local.tx_depth = depth
+        if depth == 0:
+            try:
                 self.conn.commit()
-            
-            # Return results for SELECT queries
-            if query.strip().lower().startswith('select'):
-                return self.cur.fetchall()
+            except Exception:
+                self._rollback()
+                raise
+        else:
+            cur.execute(f"RELEASE SAVEPOINT tx_{depth}")
+
+    def in_transaction(self):
+        """Whether the calling thread is inside a transaction() block."""
+        return getattr(self._local, "tx_depth", 0) > 0
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def statement_name(query):
+        """Short, stable name for a query in metrics (whitespace and IN lists collapsed)."""
+        name = re.sub(r"\s+", " ", query).strip()
+        name = re.sub(r"\(\?(, \?)+\)", "(?...)", name)
+        return name if len(name) <= 120 else name[:117] + "..."
+
+    def execute_query(self, query, params=None, prepared=False):
+        """Execute a query (insert, update, delete, or select) written with ? placeholders.
+
+        prepared=True marks a hot statement: on MySQL it runs on a server-side prepared cursor
+        so the server parses it once per connection instead of on every call.
+        """
+        if not Metrics.ENABLED and self.slow_query_seconds is None:
+            return self._execute_query(query, params, prepared)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = self._execute_query(query, params, prepared)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            if Metrics.ENABLED:
+                Metrics.record("sql " + SQLManager.statement_name(query), elapsed)
+            if self.slow_query_seconds is not None and elapsed >= self.slow_query_seconds:
+                self._log_slow_query(query, params, elapsed, result)
+
+    def _execute_query(self, query, params, prepared):
+        is_select = query.strip().lower().startswith('select')
+        in_transaction = self.in_transaction()
+        statement = self.dialect.sql(query)
+        for attempt in range(2):
+            if self._cancelled():
+                return None
+            try:
+                cur = self._prepared_cursor(statement) if prepared and self.dialect.prepared else self.cur
+                self._local.last_cursor = cur
+                cur.execute(statement, params or ())
+                self._local.last_used = time.monotonic()
+                
+                # Commit **only for write queries**, and leave it to transaction() inside one
+                if query.strip().lower().startswith(('insert', 'update', 'delete')):
+                    if not in_transaction:
+                        self.conn.commit()
+                    # Return the affected row count so callers can tell success from failure
+                    return cur.rowcount
+                
+                # Return results for SELECT queries
+                if is_select:
+                    return cur.fetchall()
+                return None
+            except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError) as e:
+                if in_transaction:
+                    # The caller's transaction() rolls back (and reports) the whole unit
+                    raise
+                # Lost connection: reconnect, but only replay reads (a write may already be committed)
+                print(f"Error executing query: {e}")
+                Metrics.count("sql lost connections")
+                self.invalidate()
+                if not is_select or attempt == 1:
+                    return None
+            except Exception as e:
+                if in_transaction:
+                    raise
+                if not self._cancelled():
+                    print(f"Error executing query: {e}")
+                    Metrics.count("sql errors")
+                self._rollback()
+                return None
+
+    # -------------------------
+    # Slow-query log
+    # -------------------------
+    def load_slow_query_threshold(self):
+        """Read slow_query_ms from the config; 0 turns the slow-query log off."""
+        try:
+            ms = float(Config.singleton().get("slow_query_ms") or SQLManager.SLOW_QUERY_MS)
+        except ValueError:
+            ms = SQLManager.SLOW_QUERY_MS
+        self.slow_query_seconds = ms / 1000 if ms > 0 else None
+
+    def slow_query_log(self):
+        """The logger behind SLOW_QUERY_FILE, created on the first slow statement."""
+        with self.lock:
+            if self._slow_log is None:
+                SQLManager.SLOW_QUERY_FILE.parent.mkdir(parents=True, exist_ok=True)
+                handler = RotatingFileHandler(
+                    SQLManager.SLOW_QUERY_FILE,
+                    maxBytes=SQLManager.SLOW_QUERY_MAX_BYTES,
+                    backupCount=SQLManager.SLOW_QUERY_BACKUPS,
+                    encoding="utf-8",
+                )
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                log = logging.getLogger("inventory.slow_queries")
+                log.setLevel(logging.INFO)
+                log.propagate = False
+                log.addHandler(handler)
+                self._slow_log = log
+            return self._slow_log
+
+    @staticmethod
+    def redact(params):
+        """Describe parameters by type (and length) only: they may hold names, codes or messages."""
+        described = []
+        for value in params or ():
+            if isinstance(value, (str, bytes)):
+                described.append(f"<{type(value).__name__}:{len(value)}>")
+            elif value is None:
+                described.append("NULL")
+            else:
+                described.append(f"<{type(value).__name__}>")
+        return "(" + ", ".join(described) + ")"
+
+    def explain(self, query, params):
+        """The backend's plan for a statement, one line per step."""
+        if not query.lstrip().lower().startswith(("select", "insert", "update", "delete", "with")):
+            return []
+        try:
+            cur = self.conn.cursor()
+            try:
+                cur.execute(self.dialect.explain(self.dialect.sql(query)), params or ())
+                return self.dialect.plan_lines(cur.fetchall())
+            finally:
+                cur.close()
         except Exception as e:
-            print(f"Error executing query: {e}")
+            return [f"plan unavailable: {e}"]
+
+    def _log_slow_query(self, query, params, elapsed, result):
+        if isinstance(result, list):
+            rows = len(result)
+        elif isinstance(result, int):
+            rows = result
+        else:
+            rows = "-"
+        Metrics.count("sql slow queries")
+        try:
+            lines = [
+                f"{elapsed * 1000:.1f} ms, rows: {rows}, backend: {self.dialect.name}",
+                "    " + " ".join(query.split()),
+                "    params: " + SQLManager.redact(params),
+            ]
+            lines.extend("    plan: " + line for line in self.explain(query, params))
+            self.slow_query_log().info("\n".join(lines))
+        except Exception as e:
+            print(f"Error writing slow-query log: {e}")
+
+    def _rollback(self):
+        try:
             self.conn.rollback()
+        except Exception as e:
+            print(f"Error rolling back: {e}")
+
+
+    def execute_many(self, query, seq_of_params, prepared=False):
+        """Execute one write statement for many parameter sets in a single transaction.
+
+        Leave prepared off for INSERTs: the plain MySQL cursor folds them into one multi-row INSERT.
+        """
+        if not Metrics.ENABLED:
+            return self._execute_many(query, seq_of_params, prepared)
+        start = time.perf_counter()
+        try:
+            return self._execute_many(query, seq_of_params, prepared)
+        finally:
+            Metrics.record("sql many " + SQLManager.statement_name(query), time.perf_counter() - start)
+
+    def _execute_many(self, query, seq_of_params, prepared):
+        statement = self.dialect.sql(query)
+        if self.in_transaction():
+            # Part of the caller's unit of work: no commit here, and failures propagate
+            cur = self._prepared_cursor(statement) if prepared and self.dialect.prepared else self.cur
+            cur.executemany(statement, seq_of_params)
+            self._local.last_used = time.monotonic()
+            return cur.rowcount
+        try:
+            cur = self._prepared_cursor(statement) if prepared and self.dialect.prepared else self.cur
+            cur.executemany(statement, seq_of_params)
+            self.conn.commit()
+            self._local.last_used = time.monotonic()
+            return cur.rowcount
+        except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError) as e:
+            print(f"Error executing query: {e}")
+            self.invalidate()
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            self._rollback()
 
 
+    def iter_query(self, query, params=None, chunk_size=1000):
+        """Yield the rows of a SELECT in fetchmany chunks instead of loading the whole result.
+
+        MySQL uses an unbuffered cursor, so rows stream from the server as they are read.
+        The first yielded value is the list of column names.
+        """
+        cur = self.conn.cursor(buffered=False) if self.mysql else self.conn.cursor()
+        try:
+            cur.execute(self.dialect.sql(query), params or ())
+            yield [column[0] for column in cur.description]
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            if self.mysql:
+                # Discard anything the caller did not read so the connection stays usable
+                try:
+                    self.conn.consume_results()
+                except Exception as e:
+                    print(f"Error discarding results: {e}")
+            cur.close()
+
     # ---------------
     # Items
     # ---------------
 
     def add_item(self, name, code, quantity):
-        """Add an item to the inventory."""
-        query = (
-            "INSERT INTO inventory (name, code, qty) VALUES (%s, %s, %s)"
-            if isinstance(self.conn, mysql.connector.MySQLConnection)
-            else "INSERT INTO inventory (name, code, qty) VALUES (?, ?, ?)"
-        )
-        self.execute_query(query, (name, code, quantity))
+        """Add an item to the inventory and return its new ID (None on failure)."""
+        if not self.in_transaction():
+            return self._atomic(self.add_item, name, code, quantity)
+        query = "INSERT INTO inventory (name, code, qty) VALUES (?, ?, ?)"
+        if self.execute_query(query, (name, code, quantity)) is None:
+            return None
+        item_id = self._local.last_cursor.lastrowid
+        self.journal_items([item_id])
+        return item_id
 
     def remove_item(self, item_id):
-        """Remove an item from the inventory by ID."""
-        query = (
-            "DELETE FROM inventory WHERE id = %s"
-            if isinstance(self.conn, mysql.connector.MySQLConnection)
-            else "DELETE FROM inventory WHERE id = ?"
-        )
-        self.execute_query(query, (item_id,))
+        """Remove an item from the inventory by ID and leave a tombstone for clients that sync incrementally."""
+        if not self.in_transaction():
+            return self._atomic(self.remove_item, item_id)
+        removed = self.execute_query("DELETE FROM inventory WHERE id = ?", (item_id,))
+        if removed:
+            self.execute_query("REPLACE INTO item_tombstones (id) VALUES (?)", (item_id,))
+            self.journal_items([item_id])
+        return removed
 
     def update_item(self, item_id, name, code, quantity):
         """Update an item in the inventory by ID."""
-        query = (
-            "UPDATE inventory SET name = %s, code = %s, qty = %s WHERE id = %s"
-            if isinstance(self.conn, mysql.connector.MySQLConnection)
-            else "UPDATE inventory SET name = ?, code = ?, qty = ? WHERE id = ?"
-        )
-        self.execute_query(query, (name, code, quantity, item_id))
+        if not self.in_transaction():
+            return self._atomic(self.update_item, item_id, name, code, quantity)
+        query = "UPDATE inventory SET name = ?, code = ?, qty = ? WHERE id = ?"
+        updated = self.execute_query(query, (name, code, quantity, item_id), prepared=True)
+        if updated:
+            self.journal_items([item_id])
+        return updated
+
+    def increment_item(self, code, delta):
+        """Atomically add delta to an item's quantity on the server (no read-modify-write)."""
+        return self.increment_items([(code, delta)])
+
+    def increment_items(self, increments):
+        """Apply many (code, delta) increments in one transaction."""
+        if not self.in_transaction():
+            return self._atomic(self.increment_items, increments)
+        increments = list(increments)
+        query = "UPDATE inventory SET qty = qty + ? WHERE code = ?"
+        updated = self.execute_many(query, [(delta, code) for code, delta in increments], prepared=True)
+        self.journal_codes(code for code, delta in increments)
+        return updated
+
+    def _atomic(self, method, *args):
+        """Run a write method in a transaction of its own, so its journal entries commit with it."""
+        try:
+            with self.transaction():
+                return method(*args)
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            Metrics.count("sql errors")
+            return None
+
+    # ---------------
+    # Change Journal
+    # ---------------
+
+    def journal_items(self, item_ids):
+        """Record that these items changed; call inside the transaction that changed them."""
+        self.execute_many("INSERT INTO changes (item_id) VALUES (?)", [(item_id,) for item_id in item_ids])
+
+    def journal_codes(self, codes):
+        """journal_items for items given by product code."""
+        codes = list(codes)
+        for start in range(0, len(codes), SQLManager.JOURNAL_CHUNK):
+            chunk = codes[start:start + SQLManager.JOURNAL_CHUNK]
+            query = f"INSERT INTO changes (item_id) SELECT id FROM inventory WHERE code IN ({', '.join(['?'] * len(chunk))})"
+            self.execute_query(query, chunk)
+
+    def latest_change_id(self):
+        """ID of the newest journal entry (0 when there is none)."""
+        self.end_snapshot()
+        rows = self.execute_query("SELECT MAX(id) FROM changes")
+        if rows is None:
+            return None
+        return rows[0][0] or 0
+
+    def change_id_before(self, mark):
+        """ID of the newest journal entry written before a sync mark's time (0 when there is none)."""
+        query = "SELECT id FROM changes WHERE changed_at < ? ORDER BY changed_at DESC, id DESC LIMIT 1"
+        rows = self.execute_query(query, (mark,))
+        if rows is None:
+            return None
+        return rows[0][0] if rows else 0
+
+    def select_changes(self, after_id, limit=1000):
+        """(id, item_id) journal entries after after_id, oldest first."""
+        self.end_snapshot()
+        query = "SELECT id, item_id FROM changes WHERE id > ? ORDER BY id LIMIT ?"
+        return self.execute_query(query, (after_id, limit), prepared=True)
+
+    def end_snapshot(self):
+        """Let the next read see other clients' commits (and other threads' of this client).
+
+        With autocommit off a MySQL connection keeps reading the snapshot its first SELECT opened,
+        so a connection that only reads has to end that transaction itself. Every read that must
+        see new rows calls this first: sync, the change feed, the log pages and both searches.
+        """
+        if self.mysql and not self.in_transaction():
+            try:
+                self.conn.commit()
+            except mysql.connector.Error as e:
+                print(f"Error ending read transaction: {e}")
+
+    def select_items_by_code(self, codes):
+        """Select the current rows for the given product codes."""
+        codes = list(codes)
+        if not codes:
+            return []
+        query = f"SELECT id, name, code, qty FROM inventory WHERE code IN ({', '.join(['?'] * len(codes))})"
+        return self.execute_query(query, codes)
+
+    def select_items_by_id(self, item_ids):
+        """Select the current rows for the given item IDs (removed items are simply missing)."""
+        item_ids = list(item_ids)
+        if not item_ids:
+            return []
+        query = f"SELECT id, name, code, qty FROM inventory WHERE id IN ({', '.join(['?'] * len(item_ids))})"
+        return self.execute_query(query, item_ids)
 
     def select_items(self):
         """Select all items from the inventory."""
-        query = "SELECT * FROM inventory"
+        query = "SELECT id, name, code, qty FROM inventory"
         return self.execute_query(query)
-    
+
+    def search_items(self, term, limit=500):
+        """Return up to limit item ids matching term: code/name prefixes first, then substrings, then fuzzy hits."""
+        term = term.strip()
+        if not term:
+            return []
+        self.end_snapshot()  # search jobs run on pool threads that keep their connection
+        dialect = self.dialect
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        ids = {}  # insertion-ordered set
+
+        def collect(query, params):
+            for (item_id,) in self.execute_query(query, params) or []:
+                ids.setdefault(item_id)
+                if len(ids) >= limit:
+                    return True
+            return False
+
+        # 1. Prefix matches through the B-tree indexes on code and name
+        for column in ("code", "name"):
+            # Ordering in the index's collation lets the scan stop after limit rows
+            query = (
+                f"SELECT id FROM inventory WHERE {column} LIKE ? {dialect.like_escape} "
+                f"ORDER BY {dialect.nocase(column)} LIMIT ?"
+            )
+            if collect(query, (escaped + "%", limit)):
+                return list(ids)
+
+        # 2. Substring matches
+        substring = dialect.item_substring(term, limit) if self.item_fts else None
+        if substring is None:
+            # Short terms (or a missing index) use a LIKE scan in the database
+            query = (
+                f"SELECT id FROM inventory WHERE code LIKE ? {dialect.like_escape} "
+                f"OR name LIKE ? {dialect.like_escape} LIMIT ?"
+            )
+            collect(query, (f"%{escaped}%", f"%{escaped}%", limit))
+            return list(ids)
+        if collect(*substring) or ids:
+            return list(ids)
+
+        # 3. Fuzzy matches: rank items by how many of the term's n-grams they share
+        fuzzy = dialect.item_fuzzy(term, limit)
+        if fuzzy is not None:
+            collect(*fuzzy)
+        return list(ids)
+
     # ---------------
-    # Logs
+    # Incremental Sync
     # ---------------
 
-    def add_log(self, user_id, message):
-        """Add a log entry."""
-        query = (
-            "INSERT INTO logs (user_id, message) VALUES (%s, %s)"
-            if isinstance(self.conn, mysql.connector.MySQLConnection)
-            else "INSERT INTO logs (user_id, message) VALUES (?, ?)"
+    def sync_items(self, mark=None):
+        """Bring a copy of the inventory up to date, reading only what changed since mark.
+
+        mark is what the previous call returned, or None for a first load. Returns (mark, rows, deleted):
+        when deleted is None, rows is the whole inventory; otherwise rows are the items added or changed
+        since mark and deleted the IDs removed since then. Returns None on failure.
+        The mark also holds the change journal position the rows are complete up to.
+        On MySQL the local snapshot is kept in step, so the next startup only reads the changes too.
+        """
+        self.end_snapshot()
+        result = self.execute_query(*self.dialect.sync_mark(SQLManager.SYNC_OVERLAP))
+        if not result:
+            return None
+        now = SQLManager._mark_text(result[0][0])
+        new_mark = (self.source, now, self.change_id_before(now))
+
+        if not self._mark_usable(mark, now):
+            rows = self.select_items()
+            if rows is None:
+                return None
+            self.prune_history(now)
+            if self.mysql:
+                SQLManager.save_snapshot(rows, new_mark[:2])
+            return new_mark, rows, None
+
+        since = mark[1]
+        rows = self.execute_query("SELECT id, name, code, qty FROM inventory WHERE updated_at >= ?", (since,), prepared=True)
+        deleted = self.execute_query("SELECT id FROM item_tombstones WHERE deleted_at >= ?", (since,), prepared=True)
+        if rows is None or deleted is None:
+            return None
+        deleted = [row[0] for row in deleted]
+        if self.mysql and (rows or deleted):
+            SQLManager.update_snapshot(rows, deleted, new_mark[:2])
+        self.prune_history(now)
+        return new_mark, rows, deleted
+
+    @staticmethod
+    def _mark_text(value):
+        # MySQL returns a datetime, SQLite the text it stores
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f") if isinstance(value, datetime) else str(value)
+
+    def _mark_usable(self, mark, now):
+        """Whether mark is from this database and recent enough that no tombstone since then was pruned."""
+        if mark is None or mark[0] != self.source:
+            return False
+        try:
+            age = datetime.fromisoformat(now) - datetime.fromisoformat(mark[1])
+        except ValueError:
+            return False
+        return age < timedelta(days=SQLManager.TOMBSTONE_DAYS - 1)
+
+    def prune_history(self, now=None):
+        """Drop tombstones older than TOMBSTONE_DAYS and journal entries older than CHANGES_DAYS.
+
+        Called from every sync and from the change feed's poll loop, but runs at most once per
+        PRUNE_INTERVAL; clients that only ever sync incrementally still prune. now is the server
+        time as sync_items reads it (read here when not given).
+        """
+        if self._pruned_at is not None and time.monotonic() - self._pruned_at < SQLManager.PRUNE_INTERVAL:
+            return
+        self._pruned_at = time.monotonic()
+        if now is None:
+            result = self.execute_query(*self.dialect.sync_mark(0))
+            if not result:
+                return
+            now = SQLManager._mark_text(result[0][0])
+        now = datetime.fromisoformat(now)
+        cutoff = (now - timedelta(days=SQLManager.TOMBSTONE_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+        self.execute_query("DELETE FROM item_tombstones WHERE deleted_at < ?", (cutoff,))
+        cutoff = (now - timedelta(days=SQLManager.CHANGES_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+        self.execute_query("DELETE FROM changes WHERE changed_at < ?", (cutoff,))
+
+    # ---------------
+    # Bulk Import
+    # ---------------
+
+    IMPORT_BATCH_SIZE = 5000
+    IMPORT_REBUILD_RATIO = 0.1  # imports of at least this share of the catalog rebuild the indexes once
+
+    @staticmethod
+    def read_item_file(path):
+        """Stream (name, code, qty) tuples from a CSV/TSV file; yields None for rows that cannot be used."""
+        path = Path(path)
+        with path.open("r", encoding="utf-8-sig", newline="") as f:
+            if path.suffix.lower() == ".tsv":
+                dialect = csv.excel_tab
+            else:
+                try:
+                    dialect = csv.Sniffer().sniff(f.read(4096), delimiters=",;\t")
+                except csv.Error:
+                    dialect = csv.excel
+                f.seek(0)
+            reader = csv.reader(f, dialect)
+
+            # Columns default to name, code, qty unless a header row names them
+            name_col, code_col, qty_col = 0, 1, 2
+            first = next(reader, None)
+            if first is None:
+                return
+            header = [cell.strip().lower() for cell in first]
+            if "code" in header:
+                code_col = header.index("code")
+                name_col = header.index("name") if "name" in header else name_col
+                qty_col = next((header.index(col) for col in ("qty", "quantity") if col in header), qty_col)
+                rows = reader
+            else:
+                rows = itertools.chain([first], reader)
+
+            for row in rows:
+                try:
+                    name, code = row[name_col].strip(), row[code_col].strip()
+                    qty = int(row[qty_col]) if qty_col < len(row) and row[qty_col].strip() else 0
+                except (IndexError, ValueError):
+                    yield None
+                    continue
+                yield (name, code, qty) if name and code and qty >= 0 else None
+
+    def import_items(self, path, progress=None, batch_size=None):
+        """Upsert every item in a CSV/TSV file on the unique code column; returns (imported, skipped)."""
+        batch_size = batch_size or SQLManager.IMPORT_BATCH_SIZE
+        imported = skipped = 0
+        batch = []
+        bulk = self._bulk_import(path)
+        if bulk:
+            self._take_down_indexes()
+        try:
+            for item in SQLManager.read_item_file(path):
+                if item is None:
+                    skipped += 1
+                    continue
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    self._import_batch(batch, imported, bulk)
+                    imported += len(batch)
+                    batch.clear()
+                    if progress is not None:
+                        progress(imported)
+            if batch:
+                self._import_batch(batch, imported, bulk)
+                imported += len(batch)
+                if progress is not None:
+                    progress(imported)
+        finally:
+            if bulk:
+                self.restore_indexes()
+        return imported, skipped
+
+    def _bulk_import(self, path):
+        """Whether an import is large enough to run without inventory's secondary indexes and triggers.
+
+        Maintained row by row, the NOCASE and substring indexes cut a SQLite import to a fifth of its
+        speed; rebuilding them costs time per catalog row instead, so it pays once an import covers
+        IMPORT_REBUILD_RATIO of the catalog.
+        """
+        if self.mysql:
+            return False  # no triggers, and InnoDB buffers FULLTEXT changes until commit
+        with open(path, "rb") as f:
+            rows = sum(1 for _ in f)
+        catalog = self.execute_query("SELECT COUNT(*) FROM inventory")
+        return catalog is not None and rows >= catalog[0][0] * SQLManager.IMPORT_REBUILD_RATIO
+
+    def _take_down_indexes(self):
+        """Drop inventory's non-unique indexes and its triggers, recording how to restore them.
+
+        Both happen in one transaction, so an import that dies part way is still cleaned up by
+        restore_indexes on the next connect. Meanwhile the upsert stamps updated_at itself; searches
+        fall back to slower plans until the import ends.
+        """
+        with self.transaction():
+            objects = self.execute_query(
+                "SELECT type, name, sql FROM sqlite_master "
+                "WHERE tbl_name = 'inventory' AND type IN ('index', 'trigger') "
+                "AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%' ORDER BY type, name"
+            )
+            for kind, name, statement in objects:
+                self.execute_query(f"DROP {kind.upper()} {name}")
+                self.execute_query("INSERT OR REPLACE INTO bulk_pending (name, statement) VALUES (?, ?)", (name, statement))
+            if self.item_fts:
+                self.execute_query(
+                    "INSERT OR REPLACE INTO bulk_pending (name, statement) VALUES (?, ?)",
+                    ("inventory_fts", "INSERT INTO inventory_fts (inventory_fts) VALUES ('rebuild')"),
+                )
+
+    def restore_indexes(self):
+        """Recreate what a bulk import took down and rebuild the substring index, in one transaction.
+
+        A bulk import does not journal its items one by one; the JOURNAL_REFRESH entry written here
+        tells change feeds to refresh instead.
+        """
+        try:
+            with self.transaction():
+                pending = self.execute_query("SELECT name, statement FROM bulk_pending ORDER BY rowid")
+                if not pending:
+                    return
+                for name, statement in pending:
+                    self.execute_query(statement)
+                self.execute_query("DELETE FROM bulk_pending")
+                self.journal_items([SQLManager.JOURNAL_REFRESH])
+        except Exception as e:
+            print(f"Error restoring indexes: {e}")
+
+    def _import_batch(self, batch, imported, bulk=False):
+        """Upsert one batch and journal it in the same transaction."""
+        try:
+            with self.transaction():
+                if not bulk and not self.mysql:
+                    self._merge_staged(batch)
+                    return
+                self.execute_many(self.dialect.upsert_item, batch)
+                if not bulk:
+                    self.journal_codes(code for name, code, qty in batch)
+        except Exception as e:
+            raise RuntimeError(f"Import stopped after {imported} rows: {e}") from e
+
+    def _merge_staged(self, batch):
+        """Upsert a batch on SQLite through a temporary table, touching and journaling only rows that differ.
+
+        Row by row, every upsert fires the substring and touch triggers and is journaled by a code
+        lookup; merging with a few set-based statements makes an import below the bulk threshold
+        several times faster. Quantity-only changes leave name out of the SET, so the substring
+        index is not rewritten for them.
+        """
+        self.execute_query("CREATE TEMP TABLE IF NOT EXISTS import_stage (code TEXT PRIMARY KEY, name TEXT NOT NULL, qty INTEGER NOT NULL)")
+        # A code listed twice keeps its last row, as with the upsert
+        self.execute_many("INSERT OR REPLACE INTO import_stage (name, code, qty) VALUES (?, ?, ?)", batch)
+        # Driving every statement from the staged codes keeps SQLite from scanning inventory
+        self.execute_query(
+            "INSERT INTO changes (item_id) SELECT i.id FROM import_stage s JOIN inventory i ON i.code = s.code "
+            "WHERE i.name <> s.name OR i.qty <> s.qty"
+        )
+        self.execute_query(
+            "UPDATE inventory SET qty = (SELECT qty FROM import_stage s WHERE s.code = inventory.code) "
+            "WHERE code IN (SELECT s.code FROM import_stage s JOIN inventory i ON i.code = s.code "
+            "WHERE i.name = s.name AND i.qty <> s.qty)"
+        )
+        self.execute_query(
+            "UPDATE inventory SET (name, qty) = (SELECT name, qty FROM import_stage s WHERE s.code = inventory.code) "
+            "WHERE code IN (SELECT s.code FROM import_stage s JOIN inventory i ON i.code = s.code WHERE i.name <> s.name)"
         )
-        self.execute_query(query, (user_id, message))
+        last_id = self.execute_query("SELECT COALESCE(MAX(id), 0) FROM inventory")[0][0]
+        self.execute_query(
+            "INSERT INTO inventory (name, code, qty) SELECT name, code, qty FROM import_stage s "
+            "WHERE NOT EXISTS (SELECT 1 FROM inventory i WHERE i.code = s.code)"
+        )
+        # AUTOINCREMENT ids only grow, so the new items are the ones past the old maximum
+        self.execute_query("INSERT INTO changes (item_id) SELECT id FROM inventory WHERE id > ?", (last_id,))
+        self.execute_query("DELETE FROM import_stage")
 
-    def select_logs(self):
-        """Select all logs."""
-        query = "SELECT * FROM logs"
-        return self.execute_query(query)
+    # ---------------
+    # Export
+    # ---------------
 
+    EXPORT_PROGRESS_EVERY = 10000
+
+    def export_query(self, query, path, fmt="csv", progress=None):
+        """Stream a SELECT into a CSV or JSONL file with constant memory; returns the row count."""
+        rows = self.iter_query(query)
+        columns = next(rows)
+        written = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if fmt == "jsonl":
+                for row in rows:
+                    f.write(json.dumps(dict(zip(columns, row)), default=str, ensure_ascii=False))
+                    f.write("\n")
+                    written += 1
+                    if progress is not None and written % SQLManager.EXPORT_PROGRESS_EVERY == 0:
+                        progress(written)
+            else:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                for row in rows:
+                    writer.writerow(row)
+                    written += 1
+                    if progress is not None and written % SQLManager.EXPORT_PROGRESS_EVERY == 0:
+                        progress(written)
+        return written
+
+    def export_items(self, path, fmt="csv", progress=None):
+        return self.export_query("SELECT id, name, code, qty FROM inventory ORDER BY id", path, fmt, progress)
+
+    def export_logs(self, path, fmt="csv", progress=None):
+        return self.export_query("SELECT id, user_id, timestamp, message FROM logs ORDER BY id", path, fmt, progress)
+
+    # ---------------
+    # Local Snapshot
+    # ---------------
 
-    
     @staticmethod
-    def save_config(parameter: str, value):
-        CONFIG_FILE = Path("data/config.json")
-        CONFIG_FILE.parent.mkdir(exist_ok=True)  # make sure 'data/' exists
+    def load_snapshot():
+        """Return (mark, rows) saved from the last MySQL session; mark is None when there is none.
+
+        The mark is the one sync_items returned with these rows, so a refresh can start from it.
+        """
+        if not SQLManager.SNAPSHOT_FILE.exists():
+            return None, []
+        conn = sqlite3.connect(SQLManager.SNAPSHOT_FILE)
+        try:
+            rows = conn.execute("SELECT id, name, code, qty FROM inventory").fetchall()
+            try:
+                mark = conn.execute("SELECT source, mark FROM sync_state").fetchone()
+            except sqlite3.OperationalError:
+                mark = None  # written before marks were kept
+            return (tuple(mark) if mark else None), rows
+        except sqlite3.Error as e:
+            print(f"Error reading snapshot: {e}")
+            return None, []
+        finally:
+            conn.close()
 
-        config = {}  # initialize in case file doesn't exist
-        if CONFIG_FILE.exists():
-            with CONFIG_FILE.open("r", encoding="utf-8") as f:
-                config = json.load(f)
+    @staticmethod
+    def _snapshot_connection():
+        SQLManager.SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(SQLManager.SNAPSHOT_FILE)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                code TEXT NOT NULL,
+                qty INTEGER NOT NULL
+            )
+        """)
+        conn.execute("CREATE TABLE IF NOT EXISTS sync_state (source TEXT NOT NULL, mark TEXT NOT NULL)")
+        return conn
 
-        # Add or update the parameter
-        encoded_value = base64.b64encode(value.encode()).decode()
-        config[parameter] = encoded_value
+    @staticmethod
+    def _save_mark(conn, mark):
+        conn.execute("DELETE FROM sync_state")
+        if mark is not None:
+            conn.execute("INSERT INTO sync_state (source, mark) VALUES (?, ?)", mark)
 
-        # Save back to file
-        with CONFIG_FILE.open("w", encoding="utf-8") as f:
-            json.dump(config, f, indent=4)  # pretty formatting
+    @staticmethod
+    def save_snapshot(items, mark=None):
+        """Replace the local snapshot with the given inventory rows."""
+        conn = None
+        try:
+            conn = SQLManager._snapshot_connection()
+            with conn:
+                conn.execute("DELETE FROM inventory")
+                conn.executemany("INSERT INTO inventory (id, name, code, qty) VALUES (?, ?, ?, ?)", items)
+                SQLManager._save_mark(conn, mark)
+        except sqlite3.Error as e:
+            print(f"Error saving snapshot: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
 
     @staticmethod
-    def load_config(parameter: str) -> str:
-        CONFIG_FILE = Path("data/config.json")
-        if not CONFIG_FILE.exists():
-            return None
+    def update_snapshot(rows, deleted, mark):
+        """Apply the changes from an incremental sync to the local snapshot."""
+        conn = None
+        try:
+            conn = SQLManager._snapshot_connection()
+            with conn:
+                conn.executemany("DELETE FROM inventory WHERE id = ?", [(item_id,) for item_id in deleted])
+                conn.executemany("REPLACE INTO inventory (id, name, code, qty) VALUES (?, ?, ?, ?)", rows)
+                SQLManager._save_mark(conn, mark)
+        except sqlite3.Error as e:
+            print(f"Error updating snapshot: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+    
+    # ---------------
+    # Logs
+    # ---------------
 
-        with CONFIG_FILE.open("r", encoding="utf-8") as f:
-            config = json.load(f)
+    def add_log(self, user_id, message):
+        """Add a log entry."""
+        query = "INSERT INTO logs (user_id, message) VALUES (?, ?)"
+        self.execute_query(query, (user_id, message), prepared=True)
 
-        encoded_value = config.get(parameter)
-        if encoded_value is None:
-            return None
+    def add_logs(self, entries):
+        """Add many (user_id, message) log entries in one transaction."""
+        query = "INSERT INTO logs (user_id, message) VALUES (?, ?)"
+        return self.execute_many(query, entries)
+
+    def select_logs(self):
+        """Select all logs."""
+        query = "SELECT * FROM logs"
+        return self.execute_query(query)
+
+    def select_logs_page(self, before=None, limit=200):
+        """Select up to limit logs, newest first, older than the (timestamp, id) keyset cursor before."""
+        # Entries come from the LogWriter thread's commits, which an old snapshot would not show
+        self.end_snapshot()
+        if before is None:
+            query = "SELECT id, user_id, timestamp, message FROM logs ORDER BY timestamp DESC, id DESC LIMIT ?"
+            return self.execute_query(query, (limit,), prepared=True)
+        # The row-value form is a single range on idx_logs_timestamp_id; the equivalent
+        # "timestamp < ? OR (timestamp = ? AND id < ?)" makes SQLite walk the index from the top
+        query = (
+            "SELECT id, user_id, timestamp, message FROM logs "
+            "WHERE (timestamp, id) < (?, ?) "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?"
+        )
+        return self.execute_query(query, (*before, limit), prepared=True)
+
+    def search_logs(self, term, limit=200, offset=0):
+        """Full-text search over log messages and users; returns a ranked page of log rows."""
+        words = re.findall(r"\w+", term)
+        if not words:
+            return []
+        self.end_snapshot()
+        if not self.log_fts:
+            # No full-text index: fall back to a substring scan
+            pattern = f"%{term.strip()}%"
+            query = (
+                "SELECT id, user_id, timestamp, message FROM logs "
+                "WHERE message LIKE ? OR user_id LIKE ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+            )
+            return self.execute_query(query, (pattern, pattern, limit, offset))
+        return self.execute_query(*self.dialect.log_search(words, limit, offset))
 
-        # Decode value
-        return base64.b64decode(encoded_value.encode()).decode()
+    def select_logs_after(self, log_id, limit=1000):
+        """Select logs written after the given id, oldest first."""
+        self.end_snapshot()
+        query = "SELECT id, user_id, timestamp, message FROM logs WHERE id > ? ORDER BY id LIMIT ?"
+        return self.execute_query(query, (log_id, limit), prepared=True)
 
 
 # Example usage
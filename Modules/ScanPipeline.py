@@ -0,0 +1,83 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+from collections import defaultdict
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from Modules.SQLManager import SQLManager
+from Modules.DatabaseWorker import DatabaseWorker
+
+class ScanPipeline(QObject):
+    """Queue scanned quantities and persist them as batched, atomic server-side increments."""
+
+    # Emitted after a flush with the authoritative rows and the deltas that were written
+    flushed = pyqtSignal(list, dict)
+
+    def __init__(self, flush_interval_ms=250, max_batch=500, parent=None):
+        super().__init__(parent)
+        self.max_batch = max_batch
+        self._pending = defaultdict(int)  # product code -> queued delta
+        self._in_flight = []              # batches submitted but not yet confirmed
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def enqueue(self, code: str, qty: int):
+        """Queue a scan; repeated scans of the same code are merged into one increment."""
+        self._pending[code] += qty
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def pending_delta(self, code: str) -> int:
+        """Quantity queued or in flight for a code that the view has not seen committed yet."""
+        return self._pending.get(code, 0) + sum(batch.get(code, 0) for batch in self._in_flight)
+
+    def flush(self, wait=False):
+        """Write every queued increment in one transaction on the database worker."""
+        self._timer.stop()
+        if not self._pending:
+            return
+        batch = dict(self._pending)
+        self._pending.clear()
+        self._in_flight.append(batch)
+
+        future = DatabaseWorker.singleton().submit(
+            ScanPipeline._write, batch,
+            on_result=lambda rows: self._on_written(batch, rows),
+        )
+        if wait:
+            future.result()
+
+    @staticmethod
+    def _write(batch):
+        """Runs on the worker thread: apply the increments, then read back the committed rows."""
+        sql = SQLManager.singleton()
+        if sql.increment_items(batch.items()) is None:
+            return None
+        return sql.select_items_by_code(batch.keys()) or []
+
+    def _on_written(self, batch, rows):
+        self._in_flight.remove(batch)
+        if rows is None:
+            # Put the batch back so the scans are retried on the next flush
+            for code, delta in batch.items():
+                self._pending[code] += delta
+            self._timer.start()
+            return
+        self.flushed.emit(rows, batch)
@@ -0,0 +1,125 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+import threading
+from PyQt6.QtCore import QObject, QTimer
+from Modules.SQLManager import SQLManager
+from Modules.DatabaseWorker import DatabaseWorker
+
+class SearchController(QObject):
+    """Search-as-you-type for a line edit: debounced, cancellable, and refined locally when the term grows."""
+
+    DELAY_MS = 250  # pause in typing before a query is sent
+
+    def __init__(self, line_edit, query, on_results, on_cleared, refine=None, delay_ms=DELAY_MS, parent=None):
+        """
+        query(term) runs on a database job thread and returns the results.
+        refine(old_term, old_results, term) runs on the GUI thread and narrows the previous results,
+        or returns None when they cannot be reused.
+        on_results(term, results) and on_cleared() are called on the GUI thread.
+        """
+        super().__init__(parent)
+        self.line_edit = line_edit
+        self.query = query
+        self.refine = refine
+        self.on_results = on_results
+        self.on_cleared = on_cleared
+
+        self.term = ""
+        self.results = None   # results shown for self.term, None while they are still loading
+        self.generation = 0   # bumped on every search so late results from older ones are dropped
+        self._task = None     # (future, cancelled event) of the query in flight
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.run)
+
+        line_edit.textChanged.connect(self._on_text_changed)
+        line_edit.returnPressed.connect(self.run)  # Enter searches without waiting for the delay
+
+    def _on_text_changed(self, text):
+        # Whatever is still running is for a term the user has already moved past
+        self.cancel()
+        self._timer.start()
+
+    def run(self):
+        """Search for the line edit's current text now."""
+        self._timer.stop()
+        term = self.line_edit.text().strip()
+        if term == self.term and (self.results is not None or self._task is not None):
+            return
+        self.cancel()
+        self.generation += 1
+        old_term, old_results = self.term, self.results
+        self.term, self.results = term, None
+
+        if not term:
+            self.on_cleared()
+            return
+
+        # A longer term only narrows the result set, so filter what is already loaded when possible
+        if self.refine is not None and old_results is not None and old_term and term.lower().startswith(old_term.lower()):
+            results = self.refine(old_term, old_results, term)
+            if results is not None:
+                self._deliver(self.generation, term, results)
+                return
+
+        generation, cancelled = self.generation, threading.Event()
+        future = DatabaseWorker.singleton().submit_job(
+            self._run_query, term, cancelled,
+            on_result=lambda results: self._deliver(generation, term, results),
+            on_error=lambda error: self._failed(generation, error),
+        )
+        self._task = (future, cancelled)
+
+    def refresh(self):
+        """Run the current search again against the database (e.g. after a full reload)."""
+        self.cancel()
+        self.term, self.results = "", None
+        self.run()
+
+    def cancel(self):
+        """Drop the query in flight: a queued one never starts and a running one is interrupted."""
+        if self._task is None:
+            return
+        future, cancelled = self._task
+        self._task = None
+        self.generation += 1
+        cancelled.set()
+        future.cancel()
+        if self.results is None:
+            # Without results the current term has to be searched again on the next run()
+            self.term = ""
+
+    def _run_query(self, term, cancelled):
+        """Runs on a job thread."""
+        with SQLManager.singleton().cancellable(cancelled):
+            return self.query(term)
+
+    def _deliver(self, generation, term, results):
+        if generation != self.generation:
+            return
+        self._task = None
+        self.results = results if results is not None else []
+        self.on_results(term, self.results)
+
+    def _failed(self, generation, error):
+        print(f"Error searching: {error}")
+        if generation == self.generation:
+            # Forget the term so the next run() tries again
+            self._task = None
+            self.term = ""
@@ -22,7 +22,7 @@ from PyQt6.QtWidgets import  (
     QDialog, 
     QPushButton,
     QMenuBar,
-    QTableWidget,
+    QTableView,
     QSpinBox,
     QComboBox,
 )
@@ -199,7 +199,7 @@ class WidgetStyle(QWidget):
     # Table styles
     # -------------------------------
     tableDefault = """
-    QTableWidget {{
+    QTableView {{
         background-color: {bgColor};
         color: {textColor};
         gridline-color: {gridLineColor};
@@ -207,7 +207,7 @@ class WidgetStyle(QWidget):
         border-radius: 6px;
         font-size: 14px;
     }}
-    QTableWidget::item {{
+    QTableView::item {{
         selection-background-color: {accentColor};
         selection-color: {textColor};
     }}
@@ -225,7 +225,7 @@ class WidgetStyle(QWidget):
     """.format(**theme)
 
     logTable = """
-        QTableWidget {
+        QTableView {
             background-color: #2C2C2C;     /* Dark background */
             color: #FFFFFF;                /* White text */
             gridline-color: #444444;       /* Subtle grid lines */
@@ -234,7 +234,7 @@ class WidgetStyle(QWidget):
             font-size: 14px;
         }
 
-        QTableWidget::item {
+        QTableView::item {
             selection-background-color: #FF6A13; /* KUKA Orange for selected rows */
             selection-color: #FFFFFF;            /* White text when selected */
         }
@@ -354,7 +354,7 @@ class WidgetStyle(QWidget):
             widget.setStyleSheet(WidgetStyle.windowDefault)
         elif isinstance(widget, QDialog):
             widget.setStyleSheet(WidgetStyle.windowDefault)
-        elif isinstance(widget, QTableWidget):
+        elif isinstance(widget, QTableView):
             widget.setStyleSheet(WidgetStyle.tableDefault)
         elif isinstance(widget, QSpinBox):
             widget.setStyleSheet(WidgetStyle.spinboxDefault)
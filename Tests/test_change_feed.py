@@ -0,0 +1,120 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+# Run from the repository root: python -m unittest discover -s Tests
+
+import os
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from Modules.SQLManager import SQLManager
+from Modules.ChangeFeed import ChangeFeed
+
+class TwoClientChangeFeedTest(unittest.TestCase):
+    """Two clients on one SQLite file: the feed of one reports what the other writes."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)  # config and slow-query log go to data/ under the current directory
+        path = Path(self._dir.name) / "inventory.db"
+        self.writer = SQLManager()
+        self.writer.connect_sqlite(path)
+        self.reader = SQLManager()
+        self.reader.connect_sqlite(path)
+
+        self.changed = []
+        self.lost = 0
+        self.feed = ChangeFeed(self.reader, gap_timeout=0.2)
+        self.feed.listeners.append(lambda rows, deleted: self.changed.append((rows, deleted)))
+        self.feed.lost_listeners.append(self.on_lost)
+        self.feed.follow(self.reader.sync_items()[0])
+
+    def tearDown(self):
+        self.writer.close()
+        self.reader.close()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    def on_lost(self):
+        self.lost += 1
+
+    def poll(self):
+        self.changed.clear()
+        self.feed.poll()
+        rows = [row for rows, _ in self.changed for row in rows]
+        deleted = [item_id for _, deleted in self.changed for item_id in deleted]
+        return rows, deleted
+
+    def add_change(self, change_id, item_id):
+        """Journal entry with a chosen ID, to leave the gaps a transaction still open would."""
+        self.writer.execute_query("INSERT INTO changes (id, item_id) VALUES (?, ?)", (change_id, item_id))
+
+    def test_sees_other_clients_writes(self):
+        item_id = self.writer.add_item("Widget", "W1", 3)
+        self.assertEqual(self.poll(), ([(item_id, "Widget", "W1", 3)], []))
+
+        self.writer.increment_item("W1", 2)
+        self.assertEqual(self.poll(), ([(item_id, "Widget", "W1", 5)], []))
+
+        self.writer.remove_item(item_id)
+        self.assertEqual(self.poll(), ([], [item_id]))
+        self.assertEqual(self.poll(), ([], []))
+
+    def test_refresh_entry_reports_lost(self):
+        self.writer.journal_items([SQLManager.JOURNAL_REFRESH])
+        self.poll()
+        self.assertEqual(self.lost, 1)
+        self.assertEqual(self.changed, [])
+
+    def test_holds_at_gap_until_filled(self):
+        first = self.writer.add_item("First", "F1", 1)
+        second = self.writer.add_item("Second", "S1", 1)
+        self.poll()
+        cursor = self.feed.cursor
+
+        self.add_change(cursor + 2, second)
+        self.assertEqual(self.poll(), ([(second, "Second", "S1", 1)], []))
+        self.assertEqual(self.feed.cursor, cursor)
+
+        # The late entry is reported; the one past the gap is not reported twice
+        self.add_change(cursor + 1, first)
+        self.assertEqual(self.poll(), ([(first, "First", "F1", 1)], []))
+        self.assertEqual(self.feed.cursor, cursor + 2)
+
+    def test_each_gap_gets_its_own_wait(self):
+        item_id = self.writer.add_item("Widget", "W1", 1)
+        self.poll()
+        cursor = self.feed.cursor
+
+        self.add_change(cursor + 2, item_id)
+        self.poll()
+        time.sleep(self.feed.gap_timeout + 0.1)
+        # The first gap filled in time; the one before cursor + 5 must not inherit its expired wait
+        self.add_change(cursor + 1, item_id)
+        self.add_change(cursor + 3, item_id)
+        self.add_change(cursor + 5, item_id)
+        self.poll()
+        self.assertEqual(self.feed.cursor, cursor + 3)
+
+        time.sleep(self.feed.gap_timeout + 0.1)
+        self.poll()
+        self.assertEqual(self.feed.cursor, cursor + 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+# Run from the repository root: python -m unittest discover -s Tests
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from Modules.SQLManager import SQLManager
+
+CATALOG = 100
+
+class ImportTest(unittest.TestCase):
+    """import_items on SQLite: the staged merge for small files, the bulk path and its recovery."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)  # config and slow-query log go to data/ under the current directory
+        self.path = Path(self._dir.name) / "inventory.db"
+        self.sql = SQLManager()
+        self.sql.connect_sqlite(self.path)
+        self.sql.execute_many(self.sql.dialect.upsert_item, [(f"Item {i}", f"C{i}", i) for i in range(CATALOG)])
+        self.schema = self.inventory_schema()
+
+    def tearDown(self):
+        self.sql.close()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    def write_file(self, rows, name="items.csv"):
+        path = Path(self._dir.name) / name
+        with path.open("w", encoding="utf-8") as f:
+            f.write("name,code,qty\n")
+            f.writelines(f"{row}\n" for row in rows)
+        return path
+
+    def inventory_schema(self):
+        return self.sql.execute_query(
+            "SELECT type, name FROM sqlite_master WHERE tbl_name = 'inventory' AND type IN ('index', 'trigger') ORDER BY name"
+        )
+
+    def item(self, code):
+        rows = self.sql.execute_query("SELECT id, name, code, qty FROM inventory WHERE code = ?", (code,))
+        return rows[0] if rows else None
+
+    def assertIndexesIntact(self):
+        self.assertEqual(self.inventory_schema(), self.schema)
+        self.assertEqual(self.sql.execute_query("SELECT COUNT(*) FROM bulk_pending"), [(0,)])
+        # Returns None (and prints) when the substring index disagrees with the table
+        self.assertIsNotNone(self.sql.execute_query("INSERT INTO inventory_fts (inventory_fts) VALUES ('integrity-check')"))
+
+    def test_small_import_merges_and_journals_changed_rows(self):
+        start = self.sql.latest_change_id()
+        path = self.write_file([
+            "Item 1,C1,1",        # unchanged
+            "Item 2,C2,20",       # new quantity
+            "Renamed,C3,3",       # new name
+            "New,N1,5",
+            "Newer,N1,6",         # a code listed twice keeps its last row
+            "Broken,,4",          # skipped
+        ])
+        self.assertFalse(self.sql._bulk_import(path))
+        self.assertEqual(self.sql.import_items(path), (5, 1))
+
+        self.assertEqual(self.item("C1")[1:], ("Item 1", "C1", 1))
+        self.assertEqual(self.item("C2")[1:], ("Item 2", "C2", 20))
+        self.assertEqual(self.item("C3")[1:], ("Renamed", "C3", 3))
+        self.assertEqual(self.item("N1")[1:], ("Newer", "N1", 6))
+        journaled = sorted(item_id for _, item_id in self.sql.select_changes(start, 100))
+        self.assertEqual(journaled, sorted([self.item("C2")[0], self.item("C3")[0], self.item("N1")[0]]))
+        self.assertEqual(self.sql.search_items("Renamed"), [self.item("C3")[0]])
+        self.assertIndexesIntact()
+
+    def test_large_import_takes_the_bulk_path(self):
+        start = self.sql.latest_change_id()
+        path = self.write_file([f"Item {i},C{i},{i + 1}" for i in range(CATALOG)] + ["Extra thing,E1,9"])
+        self.assertTrue(self.sql._bulk_import(path))
+        self.assertEqual(self.sql.import_items(path), (CATALOG + 1, 0))
+
+        self.assertEqual(self.item("C7")[1:], ("Item 7", "C7", 8))
+        # Items are not journaled one by one; a refresh entry stands for all of them
+        self.assertEqual([item_id for _, item_id in self.sql.select_changes(start, 100)], [SQLManager.JOURNAL_REFRESH])
+        self.assertEqual(self.sql.search_items("xtra thi"), [self.item("E1")[0]])
+        self.assertIndexesIntact()
+
+    def test_interrupted_bulk_import_is_restored_on_connect(self):
+        self.sql._take_down_indexes()
+        self.assertNotEqual(self.inventory_schema(), self.schema)
+        self.sql.execute_many(self.sql.dialect.upsert_item, [("Late arrival", "L1", 1)])
+        self.sql.close()
+
+        # The next start finds the pending statements and runs them
+        self.sql = SQLManager()
+        self.sql.connect_sqlite(self.path)
+        self.assertIndexesIntact()
+        self.assertEqual(self.sql.search_items("arriv"), [self.item("L1")[0]])
+
+    def test_restore_without_pending_work_does_nothing(self):
+        start = self.sql.latest_change_id()
+        self.sql.restore_indexes()
+        self.assertEqual(self.sql.latest_change_id(), start)
+        self.assertIndexesIntact()
+
+
+if __name__ == "__main__":
+    unittest.main()
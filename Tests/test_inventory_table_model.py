@@ -0,0 +1,129 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+# Run from the repository root: python -m unittest discover -s Tests
+
+import os
+import random
+import unittest
+
+# The model needs a QApplication, but never a screen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt, QPersistentModelIndex
+from PyQt6.QtTest import QAbstractItemModelTester
+from PyQt6.QtWidgets import QApplication
+from Modules.ItemStore import ItemStore
+from Modules.InventoryTableModel import InventoryTableModel
+
+ASCENDING, DESCENDING = Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder
+
+class InventoryTableModelTest(unittest.TestCase):
+    """Sorting and the view/store row mapping, checked by Qt's model tester after every change."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.rng = random.Random(3)
+        items = [(i, f"N{self.rng.randint(0, 50)}", f"C{i:05d}", self.rng.randint(0, 20)) for i in range(1, 41)]
+        self.model = InventoryTableModel(ItemStore(items))
+        self.tester = QAbstractItemModelTester(self.model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+        self.next_id = 1000
+
+    def shown(self):
+        model = self.model
+        return [tuple(model.data(model.index(row, column)) for column in range(3)) for row in range(model.rowCount())]
+
+    def assertSorted(self, column, descending):
+        keys = [row[column] for row in self.shown()]
+        self.assertEqual(keys, sorted(keys, reverse=descending))
+        # Every store row is shown exactly once, and view_row inverts store_row
+        model = self.model
+        rows = [model.store_row(view_row) for view_row in range(model.rowCount())]
+        self.assertEqual(sorted(rows), list(range(len(model.store()))))
+        for view_row, row in enumerate(rows):
+            self.assertEqual(model.view_row(row), view_row)
+
+    def random_change(self):
+        model, store, rng = self.model, self.model.store(), self.rng
+        choice = rng.random()
+        if choice < 0.3:
+            self.next_id += 1
+            model.append_row((self.next_id, f"N{rng.randint(0, 50)}", f"X{self.next_id}", rng.randint(0, 20)))
+        elif choice < 0.7:
+            row = rng.randrange(len(store))
+            item_id, name, code, qty = store[row]
+            name = f"N{rng.randint(0, 50)}" if rng.random() < 0.5 else name
+            model.update_row(row, (item_id, name, code, rng.randint(0, 20)))
+        elif len(store) > 1:
+            model.remove_row(rng.randrange(len(store)))
+
+    def test_unsorted_shows_store_order(self):
+        self.assertEqual(self.shown(), [(name, code, qty) for _, name, code, qty in self.model.store()])
+
+    def test_sort_every_column_and_order(self):
+        for column in range(3):
+            for order in (ASCENDING, DESCENDING):
+                self.model.sort(column, order)
+                self.assertSorted(column, order == DESCENDING)
+
+    def test_sorted_through_appends_updates_and_removes(self):
+        for column in range(3):
+            for order in (ASCENDING, DESCENDING):
+                self.model.sort(column, order)
+                for _ in range(40):
+                    self.random_change()
+                    self.assertSorted(column, order == DESCENDING)
+
+    def test_unsorted_through_changes(self):
+        for _ in range(40):
+            self.random_change()
+        self.assertEqual(self.shown(), [(name, code, qty) for _, name, code, qty in self.model.store()])
+
+    def test_sort_keeps_persistent_indexes(self):
+        model = self.model
+        index = QPersistentModelIndex(model.index(5, 1))
+        code = model.data(model.index(5, model.CODE))
+        for column, order in ((model.QTY, DESCENDING), (model.NAME, ASCENDING), (-1, ASCENDING)):
+            model.sort(column, order)
+            self.assertEqual(model.data(model.index(index.row(), model.CODE)), code)
+            self.assertEqual(index.column(), 1)
+
+    def test_clearing_the_sort(self):
+        self.model.sort(self.model.QTY, DESCENDING)
+        self.model.sort(-1)
+        self.test_unsorted_shows_store_order()
+
+    def test_set_store_keeps_sort(self):
+        self.model.sort(self.model.NAME, DESCENDING)
+        self.model.set_store(ItemStore([(1, "b", "B", 1), (2, "c", "C", 2), (3, "a", "A", 3)]))
+        self.assertEqual([row[0] for row in self.shown()], ["c", "b", "a"])
+
+    def test_quantity_edit_reports_the_sorted_row(self):
+        model = self.model
+        model.sort(model.QTY, DESCENDING)
+        edits = []
+        model.quantityEdited.connect(lambda item_id, qty: edits.append((item_id, qty)))
+        self.assertTrue(model.setData(model.index(0, model.QTY), "7"))
+        self.assertFalse(model.setData(model.index(0, model.QTY), "-1"))
+        self.assertFalse(model.setData(model.index(0, model.NAME), "x"))
+        self.assertEqual(edits, [(model.store().id(model.store_row(0)), 7)])
+
+
+if __name__ == "__main__":
+    unittest.main()
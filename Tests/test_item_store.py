@@ -0,0 +1,99 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+# Run from the repository root: python -m unittest discover -s Tests
+
+import unittest
+from Modules.ItemStore import ItemStore
+
+class ItemStoreTest(unittest.TestCase):
+    """Id and code lookups stay in step with the columns through every write."""
+
+    def assertConsistent(self, store):
+        ids = [store.id(row) for row in range(len(store))]
+        self.assertEqual(sorted(set(ids)), sorted(ids))
+        for row, (item_id, name, code, qty) in enumerate(store):
+            self.assertEqual(store.find(item_id), row)
+            owner = store.find_code(code)
+            self.assertIsNotNone(owner, code)
+            self.assertEqual(store.code(owner), code)
+
+    def test_rows_and_lookups(self):
+        store = ItemStore([(1, "Bolt", "B1", 5), (2, "Nut", "N1", 7)])
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store[1], (2, "Nut", "N1", 7))
+        self.assertEqual(list(store), [(1, "Bolt", "B1", 5), (2, "Nut", "N1", 7)])
+        self.assertEqual(store.find(2), 1)
+        self.assertEqual(store.find_code("B1"), 0)
+        self.assertIsNone(store.find(3))
+        self.assertIsNone(store.find_code("X"))
+        self.assertEqual(len(ItemStore()), 0)
+
+    def test_append_update_remove(self):
+        store = ItemStore([(1, "Bolt", "B1", 5)])
+        self.assertEqual(store.append((2, "Nut", "N1", 7)), 1)
+        store.update(0, (1, "Bolt", "B2", 6))
+        self.assertIsNone(store.find_code("B1"))
+        self.assertEqual(store.find_code("B2"), 0)
+        self.assertEqual(store.qty(0), 6)
+        self.assertEqual(store.remove(0), (1, "Bolt", "B2", 6))
+        self.assertEqual(list(store), [(2, "Nut", "N1", 7)])
+        self.assertIsNone(store.find(1))
+        self.assertIsNone(store.find_code("B2"))
+        self.assertConsistent(store)
+
+    def test_update_checks_id(self):
+        store = ItemStore([(1, "Bolt", "B1", 5)])
+        with self.assertRaises(ValueError):
+            store.update(0, (2, "Bolt", "B1", 5))
+
+    def test_append_rejects_known_id(self):
+        store = ItemStore([(1, "Bolt", "B1", 5)])
+        with self.assertRaises(ValueError):
+            store.append((1, "Bolt", "B9", 5))
+        self.assertEqual(len(store), 1)
+
+    def test_codes_exchanged_one_row_at_a_time(self):
+        # Two items swap codes; the feed delivers the renames one by one
+        store = ItemStore([(1, "a", "X", 1), (2, "b", "Y", 1)])
+        store.update(0, (1, "a", "Y", 1))
+        self.assertEqual(store.find_code("Y"), 0)
+        store.update(1, (2, "b", "X", 1))
+        self.assertEqual(store.find_code("Y"), 0)
+        self.assertEqual(store.find_code("X"), 1)
+        self.assertConsistent(store)
+
+    def test_shared_code_survives_remove(self):
+        store = ItemStore([(1, "a", "X", 1), (2, "b", "Y", 1), (3, "c", "Z", 1)])
+        store.update(0, (1, "a", "Z", 1))  # row 2 still holds Z until its own change arrives
+        store.remove(1)                      # moves row 2 into row 1
+        self.assertEqual(store.find_code("Z"), 0)
+        store.update(1, (3, "c", "W", 1))
+        self.assertEqual(store.find_code("Z"), 0)
+        self.assertEqual(store.find_code("W"), 1)
+        store.remove(1)
+        self.assertEqual(store.find_code("Z"), 0)
+        self.assertConsistent(store)
+
+    def test_subset(self):
+        store = ItemStore([(1, "Bolt", "B1", 5), (2, "Nut", "N1", 7), (3, "Pin", "P1", 1)])
+        subset = store.subset([3, 9, 1])
+        self.assertEqual(list(subset), [(3, "Pin", "P1", 1), (1, "Bolt", "B1", 5)])
+        self.assertConsistent(subset)
+
+
+if __name__ == "__main__":
+    unittest.main()
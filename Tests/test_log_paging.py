@@ -0,0 +1,92 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+# Run from the repository root: python -m unittest discover -s Tests
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from Modules.SQLManager import SQLManager
+
+class LogPagingTest(unittest.TestCase):
+    """select_logs_page walks the log newest first through a (timestamp, id) keyset cursor."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)  # config and slow-query log go to data/ under the current directory
+        self.sql = SQLManager()
+        self.sql.connect_sqlite(Path(self._dir.name) / "inventory.db")
+        # Several entries per second share a timestamp, so the id has to break the ties
+        self.add_logs((f"2025-01-01 10:00:{i // 4:02d}", f"entry {i}") for i in range(50))
+
+    def tearDown(self):
+        self.sql.close()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    def add_logs(self, entries):
+        self.sql.execute_many(
+            "INSERT INTO logs (user_id, timestamp, message) VALUES (?, ?, ?)",
+            [("tester", timestamp, message) for timestamp, message in entries],
+        )
+
+    def all_logs(self):
+        return self.sql.execute_query("SELECT id, user_id, timestamp, message FROM logs ORDER BY timestamp DESC, id DESC")
+
+    def pages(self, limit):
+        page = self.sql.select_logs_page(limit=limit)
+        while page:
+            yield page
+            last = page[-1]
+            page = self.sql.select_logs_page(before=(last[2], last[0]), limit=limit)
+
+    def test_pages_cover_the_log_once_in_order(self):
+        for limit in (1, 7, 50, 200):
+            rows = [row for page in self.pages(limit) for row in page]
+            self.assertEqual(rows, self.all_logs(), limit)
+
+    def test_new_entries_do_not_shift_older_pages(self):
+        pages = self.pages(10)
+        first = next(pages)
+        self.add_logs([("2025-01-01 11:00:00", "newer")])
+        rest = [row for page in pages for row in page]
+        self.assertEqual(first + rest, self.all_logs()[1:])
+
+    def test_cursor_on_a_shared_timestamp(self):
+        rows = self.all_logs()
+        middle = rows[21]
+        page = self.sql.select_logs_page(before=(middle[2], middle[0]), limit=3)
+        self.assertEqual(page, rows[22:25])
+
+    def test_keyset_uses_the_timestamp_index(self):
+        details = " ".join(self.sql.explain(
+            "SELECT id FROM logs WHERE (timestamp, id) < (?, ?) ORDER BY timestamp DESC, id DESC LIMIT 10",
+            ("2025-01-01 10:00:05", 20),
+        ))
+        # A range on the index, not a walk of it from the newest entry (what the OR form gets)
+        self.assertIn("SEARCH logs USING COVERING INDEX idx_logs_timestamp_id", details)
+        self.assertNotIn("TEMP B-TREE", details)
+
+    def test_logs_after(self):
+        rows = sorted(self.all_logs())
+        self.assertEqual(self.sql.select_logs_after(rows[44][0]), rows[45:])
+        self.assertEqual(self.sql.select_logs_after(rows[10][0], limit=2), rows[11:13])
+
+
+if __name__ == "__main__":
+    unittest.main()
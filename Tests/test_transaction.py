@@ -0,0 +1,111 @@
+# Inventory Management Application - A Python-based inventory management system using PyQt6
+# Copyright (C) 2025 Lackovič Aljaž
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See <https://www.gnu.org/licenses/> for more details.
+#
+# Dependencies:
+#  - PyQt6 (GPLv3) for the graphical user interface
+
+# Run from the repository root: python -m unittest discover -s Tests
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from Modules.SQLManager import SQLManager
+
+class Abort(Exception):
+    pass
+
+
+class TransactionTest(unittest.TestCase):
+    """transaction() commits a block as one unit; nested blocks are savepoints."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.TemporaryDirectory()
+        os.chdir(self._dir.name)  # config and slow-query log go to data/ under the current directory
+        path = Path(self._dir.name) / "inventory.db"
+        self.sql = SQLManager()
+        self.sql.connect_sqlite(path)
+        self.other = SQLManager()  # a second client, to see what has been committed
+        self.other.connect_sqlite(path)
+
+    def tearDown(self):
+        self.sql.close()
+        self.other.close()
+        os.chdir(self._cwd)
+        self._dir.cleanup()
+
+    def codes(self, sql=None):
+        rows = (sql or self.other).execute_query("SELECT code FROM inventory ORDER BY code")
+        return [row[0] for row in rows]
+
+    def test_commits_once_at_the_end(self):
+        with self.sql.transaction():
+            self.assertTrue(self.sql.in_transaction())
+            self.sql.add_item("Bolt", "B1", 1)
+            self.sql.add_item("Nut", "N1", 1)
+            self.assertEqual(self.codes(self.sql), ["B1", "N1"])
+            self.assertEqual(self.codes(), [])
+        self.assertFalse(self.sql.in_transaction())
+        self.assertEqual(self.codes(), ["B1", "N1"])
+
+    def test_exception_rolls_back_the_block(self):
+        with self.assertRaises(Abort):
+            with self.sql.transaction():
+                self.sql.add_item("Bolt", "B1", 1)
+                raise Abort()
+        self.assertFalse(self.sql.in_transaction())
+        self.assertEqual(self.codes(self.sql), [])
+        self.assertEqual(self.sql.latest_change_id(), 0)
+
+    def test_failed_savepoint_only_undoes_itself(self):
+        with self.sql.transaction():
+            self.sql.add_item("Bolt", "B1", 1)
+            with self.assertRaises(Abort):
+                with self.sql.transaction():
+                    self.sql.add_item("Nut", "N1", 1)
+                    raise Abort()
+            self.assertTrue(self.sql.in_transaction())
+            # The depth is back, so the next savepoint works too
+            with self.sql.transaction():
+                self.sql.add_item("Pin", "P1", 1)
+        self.assertEqual(self.codes(), ["B1", "P1"])
+
+    def test_failure_in_outer_block_undoes_committed_savepoints(self):
+        with self.assertRaises(Abort):
+            with self.sql.transaction():
+                with self.sql.transaction():
+                    self.sql.add_item("Bolt", "B1", 1)
+                raise Abort()
+        self.assertEqual(self.codes(), [])
+
+    def test_statements_raise_inside_a_transaction(self):
+        # Outside one, a failing statement is reported and returns None
+        self.assertIsNone(self.sql.execute_query("SELECT * FROM missing_table"))
+        with self.assertRaises(Exception):
+            with self.sql.transaction():
+                self.sql.add_item("Bolt", "B1", 1)
+                self.sql.execute_query("SELECT * FROM missing_table")
+        self.assertEqual(self.codes(), [])
+
+    def test_write_and_journal_commit_together(self):
+        item_id = self.sql.add_item("Bolt", "B1", 1)
+        self.assertEqual(self.other.select_changes(0), [(1, item_id)])
+        # A duplicate code fails the insert, and its journal entry goes with it
+        self.assertIsNone(self.sql.add_item("Other", "B1", 1))
+        self.assertEqual(self.other.latest_change_id(), 1)
+        self.assertEqual(self.codes(), ["B1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
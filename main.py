@@ -20,16 +20,20 @@ import json
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from Modules.InventoryApp import InventoryApp
-from Modules.SQLManager import SQLManager
+from Modules.Config import Config
+from Modules.Logger import Logger
+from Modules.DatabaseWorker import DatabaseWorker
 
 def load_language() -> str:
-    lang = SQLManager.load_config("language")
+    lang = Config.singleton().get("language")
     if lang is None:
         lang = "en"
     return lang
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(Logger.shutdown)  # write queued log entries before exiting
+    app.aboutToQuit.connect(lambda: DatabaseWorker.singleton().shutdown())
     window = InventoryApp(lang=load_language())
     window.show()
     sys.exit(app.exec())